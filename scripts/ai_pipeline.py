@@ -18,6 +18,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 import hashlib
+from functools import lru_cache
+
+from keyword_router import BATCH_MIN_DOCS, KeywordRouter, np
+from storage import write_json
 
 # === 설정 ===
 
@@ -57,6 +61,29 @@ CONTENT_TYPE_KEYWORDS = {
     "vlog": ["브이로그", "일상", "vlog", "daily"]
 }
 
+# 콘텐츠 타입에 따른 도메인 가중치
+TYPE_DOMAIN_WEIGHTS = {
+    "ebook": {"dtslib.kr": 3},
+    "webtoon": {"dtslib.kr": 3},
+    "audiobook": {"dtslib.kr": 3},
+    "video-course": {"dtslib.kr": 3},
+    "web-novel": {"dtslib.kr": 2},
+    "blog-post": {"parksy.kr": 2},
+    "vlog": {"parksy.kr": 3},
+}
+
+
+@lru_cache(maxsize=None)
+def content_type_router() -> KeywordRouter:
+    """콘텐츠 타입 키워드 오토마톤 (프로세스당 한 번 컴파일)"""
+    return KeywordRouter(CONTENT_TYPE_KEYWORDS)
+
+
+@lru_cache(maxsize=None)
+def domain_router() -> KeywordRouter:
+    """도메인 키워드 오토마톤 (프로세스당 한 번 컴파일)"""
+    return KeywordRouter(ROUTING_KEYWORDS)
+
 
 class AIProcessingPipeline:
     """AI 콘텐츠 처리 파이프라인"""
@@ -85,15 +112,14 @@ class AIProcessingPipeline:
         random_part = hashlib.md5(str(datetime.utcnow().timestamp()).encode()).hexdigest()[:6]
         return f"{prefix}-{timestamp}-{random_part}"
 
-    def detect_content_type(self, text: str) -> Tuple[str, float]:
+    @staticmethod
+    def detect_content_type(text: str) -> Tuple[str, float]:
         """콘텐츠 타입 감지"""
-        text_lower = text.lower()
-        scores = {}
-
-        for content_type, keywords in CONTENT_TYPE_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in text_lower)
-            if score > 0:
-                scores[content_type] = score
+        scores = {
+            content_type: score
+            for content_type, score in content_type_router().score(text).items()
+            if score > 0
+        }
 
         if not scores:
             return "blog-post", 0.5  # 기본값
@@ -102,28 +128,14 @@ class AIProcessingPipeline:
         confidence = min(scores[best_type] / 5, 1.0)
         return best_type, confidence
 
-    def detect_domain(self, text: str, content_type: str) -> Tuple[str, float]:
+    @staticmethod
+    def detect_domain(text: str, content_type: str) -> Tuple[str, float]:
         """라우팅 도메인 감지"""
-        text_lower = text.lower()
-        scores = {}
-
-        for domain, keywords in ROUTING_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in text_lower)
-            scores[domain] = score
+        scores = domain_router().score(text)
 
         # 콘텐츠 타입에 따른 가중치
-        type_domain_weights = {
-            "ebook": {"dtslib.kr": 3},
-            "webtoon": {"dtslib.kr": 3},
-            "audiobook": {"dtslib.kr": 3},
-            "video-course": {"dtslib.kr": 3},
-            "web-novel": {"dtslib.kr": 2},
-            "blog-post": {"parksy.kr": 2},
-            "vlog": {"parksy.kr": 3},
-        }
-
-        if content_type in type_domain_weights:
-            for domain, weight in type_domain_weights[content_type].items():
+        if content_type in TYPE_DOMAIN_WEIGHTS:
+            for domain, weight in TYPE_DOMAIN_WEIGHTS[content_type].items():
                 scores[domain] = scores.get(domain, 0) + weight
 
         if not any(scores.values()):
@@ -134,6 +146,55 @@ class AIProcessingPipeline:
         confidence = scores[best_domain] / total if total > 0 else 0.5
         return best_domain, confidence
 
+    @staticmethod
+    def classify_batch(texts: List[str]) -> List[Tuple[str, float, str, float]]:
+        """여러 문서 일괄 분류: [(콘텐츠 타입, 타입 신뢰도, 도메인, 도메인 신뢰도)]
+
+        detect_content_type/detect_domain과 같은 결과. NumPy가 있고 문서가
+        BATCH_MIN_DOCS개 이상이면 문서 × 타입, 문서 × 도메인 점수 행렬로 한 번에 계산한다.
+        """
+        if np is None or len(texts) < BATCH_MIN_DOCS:
+            results = []
+            for text in texts:
+                content_type, type_confidence = AIProcessingPipeline.detect_content_type(text)
+                domain, domain_confidence = AIProcessingPipeline.detect_domain(text, content_type)
+                results.append((content_type, type_confidence, domain, domain_confidence))
+            return results
+
+        rows = np.arange(len(texts))
+        type_router, route_router = content_type_router(), domain_router()
+
+        # 콘텐츠 타입 (키워드가 하나도 없으면 blog-post, 0.5)
+        type_scores = type_router.score_matrix(texts)
+        type_best = type_scores.argmax(axis=1)
+        type_max = type_scores[rows, type_best]
+        has_type = type_max > 0
+        type_index = np.where(has_type, type_best, type_router.groups.index("blog-post"))
+        type_confidence = np.where(has_type, np.minimum(type_max / 5, 1.0), 0.5)
+
+        # 도메인 (타입별 가중치 행렬을 더한 뒤 최댓값)
+        weights = np.zeros((len(type_router.groups), len(route_router.groups)), dtype=np.int64)
+        for t, content_type in enumerate(type_router.groups):
+            for domain, weight in TYPE_DOMAIN_WEIGHTS.get(content_type, {}).items():
+                weights[t, route_router.groups.index(domain)] = weight
+        domain_scores = route_router.score_matrix(texts) + weights[type_index]
+        domain_best = domain_scores.argmax(axis=1)
+        totals = domain_scores.sum(axis=1)
+        domain_confidence = domain_scores[rows, domain_best] / np.maximum(totals, 1)
+
+        # 행마다 NumPy 스칼라를 꺼내면 느리므로 파이썬 리스트로 한 번에 변환
+        results = []
+        for t, t_confidence, total, d, d_confidence in zip(
+            type_index.tolist(), type_confidence.tolist(), totals.tolist(),
+            domain_best.tolist(), domain_confidence.tolist(),
+        ):
+            if total == 0:
+                domain, confidence = "parksy.kr", 0.5
+            else:
+                domain, confidence = route_router.groups[d], d_confidence
+            results.append((type_router.groups[t], t_confidence, domain, confidence))
+        return results
+
     def extract_metadata(self, text: str) -> Dict:
         """텍스트에서 메타데이터 추출"""
         word_count = len(text.split())
@@ -208,8 +269,7 @@ class AIProcessingPipeline:
     def save_processed(self, data: Dict) -> Path:
         """처리된 데이터 저장"""
         output_file = PROCESSED_DIR / f"{data['id']}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(output_file, data)
         return output_file
 
     def process_inbox(self) -> List[Dict]:
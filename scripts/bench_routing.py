@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+DTSLIB Publisher Core - Routing Benchmark
+문서별 분류(Factory._detect_domain, AIProcessingPipeline.detect_*)와
+일괄 분류(Factory.detect_domains, AIProcessingPipeline.classify_batch)의
+처리량(docs/sec)을 비교하고 결과가 같은지 확인한다.
+
+사용법:
+    python scripts/bench_routing.py                    # 문서 20000개
+    python scripts/bench_routing.py --docs 100000 --repeat 3
+"""
+
+import time
+import random
+import argparse
+from typing import Callable, List
+
+from ai_pipeline import CONTENT_TYPE_KEYWORDS, ROUTING_KEYWORDS, AIProcessingPipeline
+from factory import DTSLIB_KEYWORDS, EAE_KEYWORDS, PARKSY_KEYWORDS, Factory
+from keyword_router import np
+
+FILLER = ["오늘은", "그리고", "정리해", "본다", "the", "and", "글을", "쓴다", "하루", "\n"]
+
+
+def make_docs(count: int, seed: int = 42) -> List[str]:
+    """키워드와 일반 단어를 섞은 합성 문서"""
+    rng = random.Random(seed)
+    vocab = PARKSY_KEYWORDS + EAE_KEYWORDS + DTSLIB_KEYWORDS
+    vocab += [kw for words in ROUTING_KEYWORDS.values() for kw in words]
+    vocab += [kw for words in CONTENT_TYPE_KEYWORDS.values() for kw in words]
+    docs = []
+    for _ in range(count):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(20, 200))]
+        words += [rng.choice(vocab) for _ in range(rng.randint(0, 8))]
+        rng.shuffle(words)
+        docs.append(" ".join(words))
+    return docs
+
+
+def measure(name: str, run: Callable, docs: List[str], repeat: int):
+    """반복 측정 (최솟값 기준), 마지막 결과 반환"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run(docs)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(f"  {name:40} {best * 1000:9.1f} ms  {len(docs) / best:10.0f} docs/sec")
+    return result
+
+
+def per_document_ai(docs: List[str]) -> list:
+    results = []
+    for text in docs:
+        content_type, type_confidence = AIProcessingPipeline.detect_content_type(text)
+        domain, domain_confidence = AIProcessingPipeline.detect_domain(text, content_type)
+        results.append((content_type, type_confidence, domain, domain_confidence))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DTSLIB Routing Benchmark")
+    parser.add_argument("--docs", type=int, default=20000, help="문서 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    docs = make_docs(args.docs)
+
+    print("=" * 60)
+    print("DTSLIB Routing Benchmark")
+    print("=" * 60)
+    print(f"문서 수: {args.docs}, 반복: {args.repeat}, NumPy: {'사용' if np is not None else '없음'}")
+    print()
+
+    print("[Factory] 도메인")
+    single = measure("문서별 _detect_domain", lambda d: [Factory._detect_domain(t) for t in d], docs, args.repeat)
+    batch = measure("일괄 detect_domains", Factory.detect_domains, docs, args.repeat)
+    print(f"  결과 일치: {single == batch}")
+    print()
+
+    print("[AIProcessingPipeline] 타입 + 도메인")
+    single = measure("문서별 detect_content_type/domain", per_document_ai, docs, args.repeat)
+    batch = measure("일괄 classify_batch", AIProcessingPipeline.classify_batch, docs, args.repeat)
+    print(f"  결과 일치: {single == batch}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
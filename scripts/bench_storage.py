@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+PARKSY Publisher Platform - Storage Benchmark
+1) 쓰기: 기존 직접 덮어쓰기(indent=2) vs 원자적 저장(indent/compact) 처리량 비교
+2) 백엔드: 설치된 JSON 백엔드별 인덱스 dump/load 시간과 파일 크기 비교
+
+사용법:
+    python scripts/bench_storage.py                        # 50k 출판물 인덱스, 전체
+    python scripts/bench_storage.py --mode backend --items 10000 --repeat 5
+"""
+
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from storage import BACKENDS, JSON_BACKEND, write_json
+
+
+def make_index(count: int) -> Dict:
+    """합성 출판물 인덱스 생성"""
+    items = []
+    for i in range(count):
+        items.append({
+            "id": f"pub-2025-01-{i % 28 + 1:02d}-sample-{i:06x}",
+            "title": f"샘플 출판물 {i}",
+            "subtitle": "",
+            "type": "article",
+            "status": "published" if i % 3 else "draft",
+            "persona": "Philosopher-Parksy",
+            "excerpt": "오늘의 생각을 기록한다. " * 8,
+            "media": {"youtube": [f"vid{i:08d}"], "spotify": []},
+            "tags": ["생각", "기록", f"tag{i % 50}"],
+            "createdAt": "2025-01-16T00:00:00Z",
+            "updatedAt": "2025-01-16T00:00:00Z",
+            "publishedAt": "2025-01-16T00:00:00Z",
+        })
+    return {"collection": "publications", "count": count, "items": items}
+
+
+def legacy_write(path: Path, data: Dict) -> None:
+    """기존 방식: 대상 파일을 직접 열어 덮어쓰기"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def measure(name: str, writer: Callable, path: Path, data: Dict, repeat: int) -> Dict:
+    """쓰기 반복 측정 (최솟값 기준)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        writer(path, data)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    size = path.stat().st_size
+    return {
+        "name": name,
+        "seconds": best,
+        "bytes": size,
+        "mbPerSec": size / best / 1e6,
+    }
+
+
+def bench_writes(data: Dict, repeat: int) -> None:
+    """쓰기 방식별 처리량"""
+    cases = [
+        ("legacy indent=2 (직접 덮어쓰기)", legacy_write),
+        ("atomic indent=2", lambda p, d: write_json(p, d)),
+        ("atomic compact", lambda p, d: write_json(p, d, compact=True)),
+    ]
+
+    print(f"[쓰기] 기본 백엔드: {JSON_BACKEND}")
+    results: List[Dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, writer in cases:
+            path = Path(tmp) / "index.json"
+            results.append(measure(name, writer, path, data, repeat))
+
+    baseline = results[0]["seconds"]
+    for r in results:
+        print(
+            f"  {r['name']:32} {r['seconds'] * 1000:8.1f} ms"
+            f"  {r['bytes'] / 1e6:7.2f} MB  {r['mbPerSec']:7.1f} MB/s"
+            f"  x{baseline / r['seconds']:.2f}"
+        )
+
+
+def bench_backends(data: Dict, repeat: int) -> None:
+    """백엔드 × 인코딩별 dump/load 시간"""
+    print("[백엔드] dump/load (최솟값)")
+    for name, (dumps, loads) in BACKENDS.items():
+        for compact in (False, True):
+            dump_times, load_times = [], []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                raw = dumps(data, compact)
+                dump_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                loads(raw)
+                load_times.append(time.perf_counter() - start)
+
+            label = f"{name} {'compact' if compact else 'indent=2'}"
+            print(
+                f"  {label:32} dump {min(dump_times) * 1000:8.1f} ms"
+                f"  load {min(load_times) * 1000:8.1f} ms  {len(raw) / 1e6:7.2f} MB"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PARKSY Storage Benchmark")
+    parser.add_argument("--mode", choices=["write", "backend", "all"], default="all", help="측정 항목")
+    parser.add_argument("--items", type=int, default=50000, help="인덱스 항목 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    data = make_index(args.items)
+
+    print("=" * 60)
+    print("PARKSY Storage Benchmark")
+    print("=" * 60)
+    print(f"항목 수: {args.items}, 반복: {args.repeat}")
+    print()
+
+    if args.mode in ("write", "all"):
+        bench_writes(data, args.repeat)
+        print()
+    if args.mode in ("backend", "all"):
+        bench_backends(data, args.repeat)
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
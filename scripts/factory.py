@@ -6,20 +6,39 @@ DTSLIB Publisher Core - Factory Engine
 사용법:
     python scripts/factory.py throw "오늘 생각한 것..."     # 던지기
     python scripts/factory.py throw --voice recording.m4a  # 음성 던지기
+    python scripts/factory.py throw --from-dir notes/       # 폴더의 .txt/.md 일괄 던지기
+    python scripts/factory.py throw --from-jsonl notes.jsonl # JSONL 일괄 던지기
     python scripts/factory.py process                       # 처리하기
+    python scripts/factory.py process --jobs 4              # 병렬 처리
+    python scripts/factory.py watch                         # 인박스 감시 (들어오는 대로 처리)
     python scripts/factory.py status                        # 상태 보기
+    python scripts/factory.py status --rebuild              # 카운터 재계산 후 상태 보기
     python scripts/factory.py publish src-20250116-001      # 출판하기
+    python scripts/factory.py db init                       # SQLite 상태 저장소 사용 시작
+    python scripts/factory.py db query -d eae --days 7      # 지난주 eae 원석
 """
 
 import os
 import sys
 import json
+import time
 import argparse
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, List
 import hashlib
 import re
+from functools import lru_cache
+
+from factory_db import SourceDatabase
+from factory_state import CounterStore, SourceIndex
+from id_allocator import SequenceAllocator
+from inbox_watch import POLL_INTERVAL, WatchMetrics, create_watcher
+from keyword_extractor import KeywordExtractor
+from keyword_router import BATCH_MIN_DOCS, KeywordRouter, load_keyword_groups, np
+from storage import loads_json, read_json, write_json, write_json_many, write_text
 
 # === 경로 설정 ===
 ROOT = Path(__file__).parent.parent
@@ -27,6 +46,15 @@ INBOX = ROOT / "inbox"
 PROCESS = ROOT / "process"
 OUTPUT = ROOT / "output"
 PIPELINES = ROOT / "pipelines"
+SEQUENCE_FILE = PROCESS / "sequence.json"
+ROUTING_KEYWORDS_FILE = PIPELINES / "routing-keywords.json"
+KEYWORD_DF_FILE = ROOT / "data" / "factory" / "keyword-df.json"
+INPUT_TYPES = ["text", "voice", "visual", "mixed"]
+BULK_FILE_SUFFIXES = {".txt", ".md"}
+WATCH_METRICS_FILE = PROCESS / "watch-metrics.json"
+WATCH_DEBOUNCE = 0.5    # 마지막 새 원석 이후 이만큼(초) 조용하면 배치 처리
+WATCH_MAX_BATCH = 100   # 배치 최대 원석 수
+STATE_DB_FILE = PROCESS / "state.db"  # 있을 때만 사용 (db init으로 생성)
 
 # === 라우팅 키워드 ===
 PARKSY_KEYWORDS = ["일상", "오늘", "생각", "느낌", "실험", "로그", "나는", "감정", "힘들", "좋아", "싫어"]
@@ -34,11 +62,38 @@ EAE_KEYWORDS = ["이론", "방법", "체계", "구조", "프레임워크", "모
 DTSLIB_KEYWORDS = ["출판", "책", "강좌", "판매", "웹툰", "시리즈", "상품", "강의", "교육", "완성"]
 
 
+DOMAIN_REASONS = {
+    "parksy": "감정적/개인적 콘텐츠",
+    "eae": "구조화/이론화 필요",
+    "dtslib": "상품화 가능"
+}
+
+
+@lru_cache(maxsize=None)
+def domain_router() -> KeywordRouter:
+    """도메인 라우터 (기본 키워드 + pipelines/routing-keywords.json, 프로세스당 한 번 컴파일)"""
+    groups = load_keyword_groups(ROUTING_KEYWORDS_FILE, {
+        "parksy": PARKSY_KEYWORDS,
+        "eae": EAE_KEYWORDS,
+        "dtslib": DTSLIB_KEYWORDS,
+    })
+    return KeywordRouter(groups)
+
+
 class Factory:
     """콘텐츠 공장"""
 
     def __init__(self):
         self._ensure_dirs()
+        self.ids = SequenceAllocator(SEQUENCE_FILE, seed=self._max_sequence)
+        self.state = SourceIndex(PROCESS, ROOT)
+        if not self.state.exists:
+            self._rebuild_state()
+        self.keywords = KeywordExtractor(KEYWORD_DF_FILE)
+        self.counters = CounterStore(PROCESS)
+        if not self.counters.exists:
+            self.rebuild_counters()
+        self.db = SourceDatabase(STATE_DB_FILE, ROOT) if STATE_DB_FILE.exists() else None
 
     def _ensure_dirs(self):
         """디렉토리 확인"""
@@ -50,25 +105,69 @@ class Factory:
             (OUTPUT / domain).mkdir(parents=True, exist_ok=True)
 
     def _generate_id(self) -> str:
-        """원석 ID 생성"""
+        """원석 ID 생성 (날짜별 카운터에서 다음 번호 할당)"""
         date = datetime.now().strftime("%Y%m%d")
-        # 오늘 생성된 원석 개수 확인
-        existing = list(INBOX.rglob(f"src-{date}-*.json"))
-        existing += list(PROCESS.rglob(f"src-{date}-*.json"))
-        seq = len(existing) + 1
+        seq = self.ids.allocate(date)
         return f"src-{date}-{seq:03d}"
 
-    def _detect_domain(self, text: str, hint: Optional[str] = None) -> tuple:
+    def _max_sequence(self, date: str) -> int:
+        """해당 날짜의 기존 원석 최대 번호 (카운터가 없는 날 처음 한 번만 호출)"""
+        max_seq = 0
+        for root in [INBOX, PROCESS]:
+            for f in root.rglob(f"src-{date}-*.json"):
+                seq = f.stem.rsplit("-", 1)[-1]
+                if seq.isdigit():
+                    max_seq = max(max_seq, int(seq))
+        return max_seq
+
+    def _rebuild_state(self) -> int:
+        """디렉토리를 훑어 원석 색인 재생성 (색인이 없을 때 한 번)"""
+        entries = {}
+        for f in INBOX.rglob("src-*.json"):
+            entries[f.stem] = (f, "inbox")
+        for f in (PROCESS / "queue").glob("src-*.json"):
+            entries[f.stem] = (f, "queued")
+        for f in (PROCESS / "done").glob("src-*.json"):
+            with open(f, "r", encoding="utf-8") as fp:
+                status = json.load(fp).get("processing", {}).get("status", "routed")
+            entries[f.stem] = (f, status)
+        self.state.rebuild(entries)
+        return len(entries)
+
+    def _ensure_keyword_table(self) -> None:
+        """키워드 DF 표가 없거나 이전 규칙으로 만든 것이면 처리된 원석 전체로 한 번 생성"""
+        if not self.keywords.outdated:
+            return
+
+        def texts():
+            for f in (PROCESS / "done").glob("src-*.json"):
+                with open(f, "r", encoding="utf-8") as fp:
+                    yield json.load(fp).get("input", {}).get("raw", "")
+
+        count = self.keywords.rebuild(texts())
+        if count:
+            print(f"🔤 키워드 문서 빈도 표 생성: {count}개 원석")
+
+    def _find_source(self, source_id: str) -> Optional[Path]:
+        """처리 대기 중인 원석 파일 찾기 (색인 우선, 색인과 다르면 디렉토리 검색)"""
+        entry = self.state.get(source_id)
+        if entry and entry["status"] in ("inbox", "queued"):
+            source_file = ROOT / entry["path"]
+            if source_file.exists():
+                return source_file
+
+        for pattern in [INBOX, PROCESS / "queue"]:
+            for f in pattern.rglob(f"{source_id}.json"):
+                return f
+        return None
+
+    @staticmethod
+    def _detect_domain(text: str, hint: Optional[str] = None) -> tuple:
         """도메인 감지"""
         if hint and hint in ["parksy", "eae", "dtslib"]:
             return hint, 1.0, f"사용자 지정: {hint}"
 
-        text_lower = text.lower()
-        scores = {
-            "parksy": sum(1 for kw in PARKSY_KEYWORDS if kw in text_lower),
-            "eae": sum(1 for kw in EAE_KEYWORDS if kw in text_lower),
-            "dtslib": sum(1 for kw in DTSLIB_KEYWORDS if kw in text_lower)
-        }
+        scores = domain_router().score(text)
 
         total = sum(scores.values())
         if total == 0:
@@ -77,25 +176,40 @@ class Factory:
         best = max(scores, key=scores.get)
         confidence = scores[best] / max(total, 1)
 
-        reasons = {
-            "parksy": "감정적/개인적 콘텐츠",
-            "eae": "구조화/이론화 필요",
-            "dtslib": "상품화 가능"
-        }
+        return best, confidence, DOMAIN_REASONS[best]
+
+    @staticmethod
+    def detect_domains(texts: List[str], hints: Optional[List[Optional[str]]] = None) -> List[tuple]:
+        """여러 문서의 도메인 일괄 감지 (_detect_domain과 같은 결과)
 
-        return best, confidence, reasons[best]
+        NumPy가 있고 문서가 BATCH_MIN_DOCS개 이상이면 문서 × 도메인 점수 행렬에서
+        최댓값/신뢰도를 한 번에 계산한다 (그보다 적으면 문서별 처리가 더 빠름).
+        """
+        hints = hints or [None] * len(texts)
+        if np is None or len(texts) < BATCH_MIN_DOCS:
+            return [Factory._detect_domain(text, hint) for text, hint in zip(texts, hints)]
+
+        router = domain_router()
+        scores = router.score_matrix(texts)
+        totals = scores.sum(axis=1)
+        best = scores.argmax(axis=1)
+        confidences = scores[np.arange(len(texts)), best] / np.maximum(totals, 1)
+
+        # 행마다 NumPy 스칼라를 꺼내면 느리므로 파이썬 리스트로 한 번에 변환
+        results = []
+        for hint, total, best_index, confidence in zip(hints, totals.tolist(), best.tolist(), confidences.tolist()):
+            if hint and hint in ["parksy", "eae", "dtslib"]:
+                results.append((hint, 1.0, f"사용자 지정: {hint}"))
+            elif total == 0:
+                results.append(("parksy", 0.5, "기본값: 샘에서 시작"))
+            else:
+                domain = router.groups[best_index]
+                results.append((domain, confidence, DOMAIN_REASONS[domain]))
+        return results
 
     def _extract_keywords(self, text: str) -> List[str]:
-        """키워드 추출 (간단한 버전)"""
-        # 한글 명사 추출 (단순화)
-        words = re.findall(r'[가-힣]{2,}', text)
-        # 빈도 계산
-        freq = {}
-        for w in words:
-            freq[w] = freq.get(w, 0) + 1
-        # 상위 10개
-        sorted_words = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-        return [w for w, _ in sorted_words[:10]]
+        """키워드 추출 (조사/어미 제거 + TF-IDF 상위 10개, 이 문서를 DF에 추가)"""
+        return self.keywords.extract(text, k=10)
 
     def throw(
         self,
@@ -108,8 +222,61 @@ class Factory:
     ) -> Dict:
         """원석 던지기"""
         source_id = self._generate_id()
+        source = self._new_source(source_id, content, input_type, mood, hint_domain, hint_format, tags)
 
-        source = {
+        # 저장
+        target_dir = INBOX / input_type
+        output_file = target_dir / f"{source_id}.json"
+        write_json(output_file, source)
+        self.state.set(source_id, output_file, "inbox")
+        self.counters.add("inbox")
+        self.counters.save()
+        if self.db:
+            self.db.upsert(source, output_file)
+
+        print(f"✨ 원석 던져짐: {source_id}")
+        print(f"   위치: {output_file.relative_to(ROOT)}")
+
+        return source
+
+    def throw_many(self, items: List[Dict]) -> List[Dict]:
+        """원석 여러 개 던지기 (ID 범위를 한 번에 예약하고 색인/카운터/DB는 일괄 기록)
+
+        items의 각 항목은 throw()의 키워드 인자와 같은 키를 가진 dict.
+        """
+        if not items:
+            return []
+
+        date = datetime.now().strftime("%Y%m%d")
+        first = self.ids.allocate(date, count=len(items))
+        sources = [
+            self._new_source(f"src-{date}-{first + i:03d}", **item)
+            for i, item in enumerate(items)
+        ]
+        paths = [INBOX / source["input"]["type"] / f"{source['id']}.json" for source in sources]
+
+        write_json_many(zip(paths, sources))
+        self.state.set_many([(source["id"], path, "inbox") for source, path in zip(sources, paths)])
+        self.state.compact()
+        self.counters.add("inbox", len(sources))
+        self.counters.save()
+        if self.db:
+            self.db.upsert_many(zip(sources, paths))
+
+        return sources
+
+    @staticmethod
+    def _new_source(
+        source_id: str,
+        content: str,
+        input_type: str = "text",
+        mood: Optional[str] = None,
+        hint_domain: Optional[str] = None,
+        hint_format: Optional[str] = None,
+        tags: Optional[List[str]] = None
+    ) -> Dict:
+        """새 원석 JSON"""
+        return {
             "id": source_id,
             "createdAt": datetime.utcnow().isoformat() + "Z",
             "input": {
@@ -138,29 +305,36 @@ class Factory:
             ]
         }
 
-        # 저장
-        target_dir = INBOX / input_type
-        output_file = target_dir / f"{source_id}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(source, f, indent=2, ensure_ascii=False)
-
-        print(f"✨ 원석 던져짐: {source_id}")
-        print(f"   위치: {output_file.relative_to(ROOT)}")
-
-        return source
-
-    def process_one(self, source_id: str) -> Dict:
-        """단일 원석 처리"""
+    def process_one(self, source_id: str, source_file: Optional[Path] = None, save: bool = True) -> Dict:
+        """단일 원석 처리 (save=False면 키워드 DF 변경분은 호출한 쪽에서 저장)"""
         # 원석 찾기
-        source_file = None
-        for pattern in [INBOX, PROCESS / "queue"]:
-            for f in pattern.rglob(f"{source_id}.json"):
-                source_file = f
-                break
+        source_file = source_file or self._find_source(source_id)
 
         if not source_file:
             raise FileNotFoundError(f"원석을 찾을 수 없음: {source_id}")
 
+        if save:
+            self._ensure_keyword_table()
+        source = self.route(source_id, source_file)
+        self.state.set(source_id, PROCESS / "done" / f"{source_id}.json", "routed")
+        if self.db:
+            self.db.upsert(source, PROCESS / "done" / f"{source_id}.json")
+        self.counters.merge(_routed_counts(source_file, source))
+        if save:
+            self.keywords.save()
+            self.counters.save()
+
+        routing = source["processing"]["routing"]
+        print(f"⚙️  처리 완료: {source_id}")
+        print(f"   → 도메인: {routing['domain']}")
+        print(f"   → 신뢰도: {routing['confidence']:.2f}")
+        print(f"   → 이유: {routing['reason']}")
+        print(f"   → 키워드: {', '.join(source['processing']['analysis']['keywords'][:5])}")
+
+        return source
+
+    def route(self, source_id: str, source_file: Path) -> Dict:
+        """원석 분석/라우팅 후 done 폴더에 저장하고 원본 삭제 (색인/출력 없음, 워커에서도 호출)"""
         with open(source_file, "r", encoding="utf-8") as f:
             source = json.load(f)
 
@@ -211,18 +385,11 @@ class Factory:
 
         # done 폴더로 이동
         done_file = PROCESS / "done" / f"{source_id}.json"
-        with open(done_file, "w", encoding="utf-8") as f:
-            json.dump(source, f, indent=2, ensure_ascii=False)
+        write_json(done_file, source)
 
         # 원본 삭제
         source_file.unlink()
 
-        print(f"⚙️  처리 완료: {source_id}")
-        print(f"   → 도메인: {domain}")
-        print(f"   → 신뢰도: {confidence:.2f}")
-        print(f"   → 이유: {reason}")
-        print(f"   → 키워드: {', '.join(keywords[:5])}")
-
         return source
 
     def _suggest_formats(self, domain: str, word_count: int) -> List[str]:
@@ -243,48 +410,177 @@ class Factory:
             else:
                 return ["ebook-chapter", "course-script"]
 
-    def process_all(self) -> List[Dict]:
-        """인박스의 모든 원석 처리"""
+    def process_all(self, jobs: int = 1) -> List[Dict]:
+        """인박스의 모든 원석 처리
+
+        jobs > 1이면 프로세스 풀에서 병렬 처리한다. 워커는 분석 결과를 done
+        폴더에 원자적으로 저장하고, 색인 기록과 집계는 메인 프로세스가 맡는다.
+        """
+        files = [
+            f
+            for input_type in ["text", "voice", "visual", "mixed"]
+            for f in sorted((INBOX / input_type).glob("src-*.json"))
+        ]
+        started = time.perf_counter()
+        self._ensure_keyword_table()
+        results, failures = self._process_files(files, jobs)
+
+        elapsed = time.perf_counter() - started
+        domain_counts = {"parksy": 0, "eae": 0, "dtslib": 0}
+        for source in results:
+            domain = source["processing"]["routing"]["domain"]
+            domain_counts[domain] = domain_counts.get(domain, 0) + 1
+
+        print()
+        print(f"📦 처리 결과: 성공 {len(results)}개, 실패 {len(failures)}개")
+        print("   " + ", ".join(f"{domain} {count}" for domain, count in domain_counts.items()))
+        if files:
+            print(f"   {elapsed:.2f}초, {len(files) / max(elapsed, 1e-9):.1f}개/초")
+
+        return results
+
+    def _process_files(self, files: List[Path], jobs: int = 1) -> tuple:
+        """원석 파일 목록 처리 (반환값: (처리된 원석 목록, [(원석 ID, 오류 메시지)]))"""
+        jobs = jobs or os.cpu_count() or 1
         results = []
-        for input_type in ["text", "voice", "visual", "mixed"]:
-            inbox_dir = INBOX / input_type
-            for f in inbox_dir.glob("src-*.json"):
+        failures = []
+        if jobs > 1 and len(files) > 1:
+            print(f"병렬 처리: {len(files)}개 원석, 워커 {jobs}개")
+            chunksize = max(1, len(files) // (jobs * 4))
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_route_worker,
+                initargs=(self.keywords.table,),
+            ) as executor:
+                outcomes = list(executor.map(_route_source_job, files, chunksize=chunksize))
+
+            routed = []
+            for f, (source, keyword_delta, error) in zip(files, outcomes):
+                if error:
+                    failures.append((f.stem, error))
+                    print(f"❌ 처리 실패: {f.stem} - {error}")
+                else:
+                    results.append(source)
+                    routed.append((f.stem, PROCESS / "done" / f.name, "routed"))
+                    self.keywords.merge(keyword_delta)
+                    self.counters.merge(_routed_counts(f, source))
+            self.state.set_many(routed)
+            if self.db:
+                self.db.upsert_many((source, path) for source, (_, path, _) in zip(results, routed))
+        else:
+            for f in files:
                 source_id = f.stem
                 try:
-                    result = self.process_one(source_id)
+                    result = self.process_one(source_id, f, save=False)
                     results.append(result)
                 except Exception as e:
+                    failures.append((source_id, str(e)))
                     print(f"❌ 처리 실패: {source_id} - {e}")
-        return results
-
-    def status(self) -> Dict:
-        """공장 상태"""
-        inbox_count = sum(len(list((INBOX / t).glob("*.json"))) for t in ["text", "voice", "visual", "mixed"])
-        queue_count = len(list((PROCESS / "queue").glob("*.json")))
-        done_count = len(list((PROCESS / "done").glob("*.json")))
+        self.state.compact()
+        self.keywords.save()
+        self.counters.save()
+        return results, failures
 
-        domain_counts = {}
-        for domain in ["parksy", "eae", "dtslib"]:
-            domain_counts[domain] = len(list((OUTPUT / domain).glob("*"))) - 1  # TEMPLATE.md 제외
+    def watch(
+        self,
+        jobs: int = 1,
+        debounce: float = WATCH_DEBOUNCE,
+        max_batch: int = WATCH_MAX_BATCH,
+        poll: bool = False,
+        interval: float = POLL_INTERVAL
+    ) -> WatchMetrics:
+        """인박스를 감시하며 들어오는 원석 처리 (Ctrl+C로 종료)
+
+        새 원석이 생기면 debounce초 동안 더 들어오는 것을 모아 한 배치로 처리한다
+        (max_batch개가 모이면 바로 처리). 배치마다 대기열 길이와 던진 시각 →
+        라우팅 시각 지연을 process/watch-metrics.json에 기록한다.
+        """
+        watcher = create_watcher([INBOX / t for t in INPUT_TYPES], poll=poll, interval=interval)
+        metrics = WatchMetrics(watcher.backend)
+        self._ensure_keyword_table()
+
+        pending = watcher.scan()
+        last_event = float("-inf")
+        print(f"👀 인박스 감시 시작 ({watcher.backend}), 대기 중인 원석 {len(pending)}개")
+        try:
+            while True:
+                timeout = None
+                if pending:
+                    quiet = time.monotonic() - last_event
+                    if quiet >= debounce or len(pending) >= max_batch:
+                        batch = sorted(pending, key=lambda f: f.name)[:max_batch]
+                        pending.difference_update(batch)
+                        results, failures = self._process_files([f for f in batch if f.exists()], jobs)
+                        metrics.record_batch(results, len(failures), len(pending))
+                        metrics.save(WATCH_METRICS_FILE)
+                        latency = metrics.latency()
+                        print(
+                            f"📦 배치 {metrics.batches}: 성공 {len(results)}개, 실패 {len(failures)}개, "
+                            f"대기 {len(pending)}개, 지연 p50 {latency.get('p50', 0):.2f}초 / p95 {latency.get('p95', 0):.2f}초"
+                        )
+                        continue
+                    timeout = debounce - quiet
+
+                new_files = watcher.wait(timeout)
+                if new_files:
+                    pending.update(new_files)
+                    last_event = time.monotonic()
+        except KeyboardInterrupt:
+            print()
+            print(f"🛑 감시 종료: 처리 {metrics.processed}개, 실패 {metrics.failed}개, 배치 {metrics.batches}개")
+        finally:
+            watcher.close()
+        return metrics
 
-        # 라우팅 통계
-        routing_stats = {"parksy": 0, "eae": 0, "dtslib": 0}
-        for f in (PROCESS / "done").glob("*.json"):
-            with open(f, "r", encoding="utf-8") as fp:
-                data = json.load(fp)
-                domain = data.get("processing", {}).get("routing", {}).get("domain")
-                if domain in routing_stats:
-                    routing_stats[domain] += 1
+    def status(self) -> Dict:
+        """공장 상태 (집계 카운터에서 읽음)"""
+        counters = self.counters.load()
 
         return {
-            "inbox": inbox_count,
-            "queue": queue_count,
-            "processed": done_count,
-            "output": domain_counts,
-            "routing": routing_stats,
+            "inbox": counters.get("inbox", 0),
+            "queue": counters.get("queue", 0),
+            "processed": counters.get("processed", 0),
+            "output": {domain: counters.get(f"output.{domain}", 0) for domain in ["parksy", "eae", "dtslib"]},
+            "routing": {domain: counters.get(f"routing.{domain}", 0) for domain in ["parksy", "eae", "dtslib"]},
             "timestamp": datetime.utcnow().isoformat() + "Z"
         }
 
+    def rebuild_counters(self, jobs: int = 0) -> int:
+        """디렉토리를 다시 세어 집계 카운터 재생성 (처리된 원석은 프로세스 풀에서 읽음)
+
+        반환값은 읽은 처리 완료 원석 수.
+        """
+        counters = Counter()
+        counters["inbox"] = sum(len(list((INBOX / t).glob("*.json"))) for t in ["text", "voice", "visual", "mixed"])
+        counters["queue"] = len(list((PROCESS / "queue").glob("*.json")))
+        for domain in ["parksy", "eae", "dtslib"]:
+            counters[f"output.{domain}"] = sum(1 for f in (OUTPUT / domain).glob("*") if f.name != "TEMPLATE.md")
+
+        done_files = sorted((PROCESS / "done").glob("*.json"))
+        counters["processed"] = len(done_files)
+        jobs = jobs or os.cpu_count() or 1
+        if jobs > 1 and len(done_files) > 1:
+            chunksize = max(1, len(done_files) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                domains = list(executor.map(_read_domain_job, done_files, chunksize=chunksize))
+        else:
+            domains = [_read_domain_job(f) for f in done_files]
+        counters.update(f"routing.{domain}" for domain in domains if domain)
+
+        self.counters.rebuild(counters)
+        return len(done_files)
+
+    def init_database(self) -> int:
+        """SQLite 상태 저장소 생성 후 디스크의 원석 전체 가져오기 (이미 있으면 갱신)"""
+        self.db = SourceDatabase(STATE_DB_FILE, ROOT)
+        self.db.conn  # 원석이 하나도 없어도 파일과 스키마는 만들어 둠
+        files = [
+            *INBOX.rglob("src-*.json"),
+            *(PROCESS / "queue").glob("src-*.json"),
+            *(PROCESS / "done").glob("src-*.json"),
+        ]
+        return self.db.import_files(files)
+
     def publish(self, source_id: str) -> Dict:
         """원석을 출판물로 변환"""
         # 처리된 원석 찾기
@@ -304,6 +600,7 @@ class Factory:
         slug = re.sub(r'[^가-힣a-z0-9]+', '-', suggested_title.lower())[:30]
         output_filename = f"{date_str}-{slug}.md"
         output_path = OUTPUT / domain / output_filename
+        is_new_output = not output_path.exists()
 
         # 템플릿 적용
         if domain == "parksy":
@@ -383,8 +680,7 @@ status: draft
 © DTSLIB Publishing
 """
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(output_content)
+        write_text(output_path, output_content)
 
         # 원석 업데이트
         source["output"] = {
@@ -400,8 +696,13 @@ status: draft
             "details": f"출판됨 → {domain}/{output_filename}"
         })
 
-        with open(source_file, "w", encoding="utf-8") as f:
-            json.dump(source, f, indent=2, ensure_ascii=False)
+        write_json(source_file, source)
+        self.state.set(source_id, source_file, "published")
+        if self.db:
+            self.db.upsert(source, source_file)
+        if is_new_output:
+            self.counters.add(f"output.{domain}")
+            self.counters.save()
 
         print(f"📚 출판 완료: {source_id}")
         print(f"   → 도메인: {domain}")
@@ -410,6 +711,95 @@ status: draft
         return source
 
 
+def load_bulk_items(
+    from_dir: Optional[Path] = None,
+    from_jsonl: Optional[Path] = None,
+    defaults: Optional[Dict] = None
+) -> List[Dict]:
+    """일괄 던지기 항목 읽기 (throw_many 인자 형식)
+
+    --from-dir: 폴더 아래 .txt/.md 파일 하나가 원석 하나 (경로 순)
+    --from-jsonl: 한 줄에 문자열 하나 또는
+        {"content", "type", "mood", "domain", "format", "tags"} 객체 하나
+    항목에 없는 값은 defaults(명령줄 옵션)를 쓰고, 비었거나 잘못된 항목은 경고 후 건너뛴다.
+    """
+    defaults = defaults or {}
+    records = []
+    if from_dir:
+        for f in sorted(from_dir.rglob("*")):
+            if f.is_file() and f.suffix.lower() in BULK_FILE_SUFFIXES:
+                records.append((str(f), {"content": f.read_text(encoding="utf-8")}))
+    if from_jsonl:
+        with open(from_jsonl, "rb") as fp:
+            for line_no, line in enumerate(fp, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = loads_json(line)
+                except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+                    print(f"[WARN] {from_jsonl.name}:{line_no} JSON 파싱 실패, 건너뜀 - {e}")
+                    continue
+                records.append((f"{from_jsonl.name}:{line_no}", {"content": record} if isinstance(record, str) else record))
+
+    items = []
+    for origin, record in records:
+        if not isinstance(record, dict):
+            print(f"[WARN] {origin} 문자열 또는 객체가 아님, 건너뜀")
+            continue
+        content = record.get("content") or record.get("raw")
+        input_type = record.get("type") or defaults.get("input_type") or "text"
+        if not isinstance(content, str) or not content.strip():
+            print(f"[WARN] {origin} 내용 없음, 건너뜀")
+            continue
+        if input_type not in INPUT_TYPES:
+            print(f"[WARN] {origin} 알 수 없는 입력 타입 '{input_type}', 건너뜀")
+            continue
+        items.append({
+            "content": content,
+            "input_type": input_type,
+            "mood": record.get("mood") or defaults.get("mood"),
+            "hint_domain": record.get("domain") or defaults.get("hint_domain"),
+            "hint_format": record.get("format") or defaults.get("hint_format"),
+            "tags": record.get("tags") or defaults.get("tags"),
+        })
+    return items
+
+
+def _routed_counts(source_file: Path, source: Dict) -> Dict[str, int]:
+    """원석 하나를 라우팅했을 때의 카운터 변경분"""
+    origin = "queue" if source_file.parent == PROCESS / "queue" else "inbox"
+    return {origin: -1, "processed": 1, f"routing.{source['processing']['routing']['domain']}": 1}
+
+
+def _read_domain_job(done_file: Path) -> Optional[str]:
+    """프로세스 풀 워커: 처리된 원석의 라우팅 도메인 읽기"""
+    with open(done_file, "r", encoding="utf-8") as f:
+        return json.load(f).get("processing", {}).get("routing", {}).get("domain")
+
+
+_worker_factory = None  # 프로세스 풀 워커마다 하나 (_init_route_worker에서 생성)
+
+
+def _init_route_worker(keyword_table: Dict) -> None:
+    """프로세스 풀 워커 초기화: Factory 하나를 만들고 부모가 읽은 키워드 DF 표를 씀
+
+    모든 워커가 같은 DF 스냅샷으로 점수를 매기고, DF 파일을 원석마다 다시 읽지 않는다.
+    """
+    global _worker_factory
+    _worker_factory = Factory()
+    _worker_factory.keywords.use_table(keyword_table)
+
+
+def _route_source_job(source_file: Path) -> tuple:
+    """프로세스 풀 워커: 원석 하나 라우팅 (반환값: (원석, 키워드 DF 변경분, 오류 메시지))"""
+    try:
+        source = _worker_factory.route(source_file.stem, source_file)
+        return source, _worker_factory.keywords.take_pending(), None
+    except Exception as e:
+        _worker_factory.keywords.take_pending()
+        return None, None, str(e)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="DTSLIB Publisher Core - Factory Engine",
@@ -419,9 +809,17 @@ def main():
   %(prog)s throw "오늘 느낀 것..."              # 텍스트 던지기
   %(prog)s throw -m excited "아이디어!"        # 감정과 함께 던지기
   %(prog)s throw -d eae "이론 정리..."         # 도메인 힌트와 함께
+  %(prog)s throw --from-dir notes/              # 폴더의 .txt/.md 일괄 던지기
+  %(prog)s throw --from-jsonl notes.jsonl       # JSONL 한 줄 = 원석 하나
   %(prog)s process                              # 모든 인박스 처리
+  %(prog)s process -j 4                         # 워커 4개로 병렬 처리
+  %(prog)s watch                                # 인박스 감시하며 자동 처리
   %(prog)s status                               # 공장 상태 확인
+  %(prog)s status --rebuild                     # 디스크에서 카운터 다시 세기
   %(prog)s publish src-20250116-001             # 출판하기
+  %(prog)s db init                              # SQLite 상태 저장소 사용 시작
+  %(prog)s db query -d eae --days 7             # 지난 7일 eae 원석
+  %(prog)s db export --out backup/              # 원석 JSON 파일로 내보내기
         """
     )
 
@@ -431,6 +829,8 @@ def main():
     throw_parser = subparsers.add_parser("throw", help="원석 던지기")
     throw_parser.add_argument("content", nargs="?", help="던질 내용")
     throw_parser.add_argument("-f", "--file", type=Path, help="파일에서 읽기")
+    throw_parser.add_argument("--from-dir", type=Path, help="폴더의 .txt/.md 파일을 각각 원석으로 일괄 던지기")
+    throw_parser.add_argument("--from-jsonl", type=Path, help="JSONL 파일의 각 줄을 원석으로 일괄 던지기")
     throw_parser.add_argument("-t", "--type", default="text",
         choices=["text", "voice", "visual", "mixed"], help="입력 타입")
     throw_parser.add_argument("-m", "--mood",
@@ -443,14 +843,37 @@ def main():
     # process
     process_parser = subparsers.add_parser("process", help="원석 처리하기")
     process_parser.add_argument("source_id", nargs="?", help="특정 원석 ID (없으면 전체)")
+    process_parser.add_argument("-j", "--jobs", type=int, default=1, help="병렬 워커 수 (0이면 CPU 수)")
+
+    # watch
+    watch_parser = subparsers.add_parser("watch", help="인박스 감시하며 자동 처리")
+    watch_parser.add_argument("-j", "--jobs", type=int, default=1, help="병렬 워커 수 (0이면 CPU 수)")
+    watch_parser.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE, help="배치로 모으는 대기 시간 (초)")
+    watch_parser.add_argument("--max-batch", type=int, default=WATCH_MAX_BATCH, help="배치 최대 원석 수")
+    watch_parser.add_argument("--poll", action="store_true", help="inotify 대신 폴링 사용")
+    watch_parser.add_argument("--interval", type=float, default=POLL_INTERVAL, help="폴링 간격 (초)")
 
     # status
-    subparsers.add_parser("status", help="공장 상태 확인")
+    status_parser = subparsers.add_parser("status", help="공장 상태 확인")
+    status_parser.add_argument("--rebuild", action="store_true", help="디스크에서 카운터 다시 세기")
+    status_parser.add_argument("-j", "--jobs", type=int, default=0, help="재계산 워커 수 (0이면 CPU 수)")
 
     # publish
     publish_parser = subparsers.add_parser("publish", help="출판하기")
     publish_parser.add_argument("source_id", help="원석 ID")
 
+    # db
+    db_parser = subparsers.add_parser("db", help="SQLite 상태 저장소")
+    db_subparsers = db_parser.add_subparsers(dest="db_command", required=True)
+    db_subparsers.add_parser("init", help="생성 후 기존 원석 가져오기")
+    query_parser = db_subparsers.add_parser("query", help="원석 조회")
+    query_parser.add_argument("-s", "--status", choices=["inbox", "queued", "routed", "published"], help="상태")
+    query_parser.add_argument("-d", "--domain", choices=["parksy", "eae", "dtslib"], help="도메인")
+    query_parser.add_argument("--days", type=float, help="최근 N일 안에 던져진 것만")
+    query_parser.add_argument("--limit", type=int, default=50, help="최대 개수")
+    export_parser = db_subparsers.add_parser("export", help="원석 JSON 파일로 내보내기")
+    export_parser.add_argument("--out", type=Path, help="내보낼 디렉토리 (기본: 저장소 루트)")
+
     args = parser.parse_args()
 
     if not args.command:
@@ -465,7 +888,24 @@ def main():
     print("═" * 50)
     print()
 
-    if args.command == "throw":
+    if args.command == "throw" and (args.from_dir or args.from_jsonl):
+        started = time.perf_counter()
+        items = load_bulk_items(args.from_dir, args.from_jsonl, {
+            "input_type": args.type,
+            "mood": args.mood,
+            "hint_domain": args.domain,
+            "tags": args.tags,
+        })
+        if not items:
+            print("❌ 던질 내용이 없습니다.")
+            sys.exit(1)
+
+        sources = factory.throw_many(items)
+        elapsed = time.perf_counter() - started
+        print(f"✨ 원석 {len(sources)}개 던져짐: {sources[0]['id']} ~ {sources[-1]['id']}")
+        print(f"   {elapsed:.2f}초, {len(sources) / max(elapsed, 1e-9):.1f}개/초")
+
+    elif args.command == "throw":
         content = args.content
         if args.file:
             with open(args.file, "r", encoding="utf-8") as f:
@@ -487,10 +927,23 @@ def main():
         if args.source_id:
             factory.process_one(args.source_id)
         else:
-            results = factory.process_all()
-            print(f"\n총 {len(results)}개 원석 처리됨")
+            factory.process_all(jobs=args.jobs)
+
+    elif args.command == "watch":
+        factory.watch(
+            jobs=args.jobs,
+            debounce=args.debounce,
+            max_batch=args.max_batch,
+            poll=args.poll,
+            interval=args.interval
+        )
 
     elif args.command == "status":
+        if args.rebuild:
+            started = time.perf_counter()
+            count = factory.rebuild_counters(jobs=args.jobs)
+            print(f"🔄 카운터 재계산: 처리된 원석 {count}개, {time.perf_counter() - started:.2f}초")
+            print()
         status = factory.status()
         print("📊 공장 상태")
         print()
@@ -506,10 +959,37 @@ def main():
         print("  출판 현황:")
         for domain, count in status['output'].items():
             print(f"    {domain:8}: {count}개")
+        watch_metrics = read_json(WATCH_METRICS_FILE)
+        if watch_metrics:
+            latency = watch_metrics["latency"]
+            print()
+            print(f"  감시 모드 ({watch_metrics['backend']}, {watch_metrics['updatedAt']} 기준):")
+            print(f"    처리 {watch_metrics['processed']}개, 실패 {watch_metrics['failed']}개, 대기 {watch_metrics['queueDepth']}개")
+            if latency["count"]:
+                print(f"    지연: 평균 {latency['avg']:.2f}초, p95 {latency['p95']:.2f}초, 최대 {latency['max']:.2f}초")
 
     elif args.command == "publish":
         factory.publish(args.source_id)
 
+    elif args.command == "db":
+        if args.db_command == "init":
+            count = factory.init_database()
+            print(f"🗄️  상태 저장소 준비: {STATE_DB_FILE.relative_to(ROOT)} (원석 {count}개)")
+        elif not factory.db:
+            print("❌ 상태 저장소가 없습니다. 먼저 'db init'을 실행하세요.")
+            sys.exit(1)
+        elif args.db_command == "query":
+            since = None
+            if args.days is not None:
+                since = (datetime.utcnow() - timedelta(days=args.days)).isoformat() + "Z"
+            rows = factory.db.query(status=args.status, domain=args.domain, since=since, limit=args.limit)
+            print(f"🔎 원석 {len(rows)}개")
+            for row in rows:
+                print(f"  {row['id']}  {row['status']:9} {row['domain'] or '-':7} {row['created_at'][:10]}  {row['title'] or ''}")
+        elif args.db_command == "export":
+            count = factory.db.export(args.out)
+            print(f"📤 원석 {count}개 내보냄 → {args.out or ROOT}")
+
     print()
     print("═" * 50)
 
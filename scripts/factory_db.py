@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+DTSLIB Publisher Core - Factory State Database
+원석 상태/라우팅/이력을 담는 SQLite 저장소 (선택 사항)
+
+process/state.db가 있으면 Factory가 throw/process/publish 때마다 원석을 함께
+기록한다. 원석 JSON 파일은 그대로 쓰이고, 데이터베이스는 "지난주 eae 원석"
+같은 조회를 디렉토리 스캔 없이 색인으로 처리하기 위한 것이다.
+
+- WAL 모드: 여러 프로세스가 동시에 던져도 읽기가 막히지 않고, 쓰기는
+  busy_timeout 동안 기다렸다가 순서대로 처리된다.
+- 색인: 상태, 도메인, 생성 시각, (도메인, 생성 시각)
+- export(): 저장된 원석을 원래 경로 구조 그대로 JSON 파일로 내보냄
+
+사용법:
+    python scripts/factory.py db init                       # 기존 원석 가져오기
+    python scripts/factory.py db query -d eae --days 7      # 지난 7일 eae 원석
+    python scripts/factory.py db export --out backup/       # JSON 파일로 내보내기
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from storage import write_json
+
+SCHEMA_VERSION = 1
+BUSY_TIMEOUT_MS = 30000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id           TEXT PRIMARY KEY,
+    path         TEXT NOT NULL,
+    status       TEXT NOT NULL,
+    input_type   TEXT,
+    domain       TEXT,
+    confidence   REAL,
+    title        TEXT,
+    created_at   TEXT,
+    processed_at TEXT,
+    published_at TEXT,
+    data         TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sources_status ON sources (status);
+CREATE INDEX IF NOT EXISTS idx_sources_domain ON sources (domain);
+CREATE INDEX IF NOT EXISTS idx_sources_created ON sources (created_at);
+CREATE INDEX IF NOT EXISTS idx_sources_domain_created ON sources (domain, created_at);
+
+CREATE TABLE IF NOT EXISTS history (
+    source_id TEXT NOT NULL REFERENCES sources (id) ON DELETE CASCADE,
+    seq       INTEGER NOT NULL,
+    timestamp TEXT,
+    action    TEXT,
+    details   TEXT,
+    PRIMARY KEY (source_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_history_action_time ON history (action, timestamp);
+"""
+
+COLUMNS = ("id", "path", "status", "input_type", "domain", "confidence", "title",
+           "created_at", "processed_at", "published_at")
+
+
+def _row(source: Dict, path: str) -> Tuple:
+    """원석 JSON → sources 행"""
+    processing = source.get("processing") or {}
+    routing = processing.get("routing") or {}
+    analysis = processing.get("analysis") or {}
+    return (
+        source["id"],
+        path,
+        processing.get("status", "inbox"),
+        (source.get("input") or {}).get("type"),
+        routing.get("domain"),
+        routing.get("confidence"),
+        analysis.get("suggestedTitle"),
+        source.get("createdAt"),
+        processing.get("processedAt"),
+        (source.get("output") or {}).get("publishedAt"),
+        json.dumps(source, ensure_ascii=False),
+    )
+
+
+class SourceDatabase:
+    """원석 상태 SQLite 저장소 (최초 사용 시 연결)"""
+
+    def __init__(self, db_file: Path, root: Path):
+        self.db_file = db_file
+        self.root = root
+        self._conn = None
+
+    @property
+    def exists(self) -> bool:
+        """데이터베이스 파일 존재 여부"""
+        return self.db_file.exists()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """연결 (WAL 모드, 스키마 생성)"""
+        if self._conn is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_file, timeout=BUSY_TIMEOUT_MS / 1000)
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            with conn:
+                conn.executescript(SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """연결 닫기"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _relative(self, path: Path) -> str:
+        """저장소 루트 기준 상대 경로"""
+        return Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+
+    # === 기록 ===
+
+    def upsert(self, source: Dict, path: Path) -> None:
+        """원석 하나 기록 (상태/라우팅 갱신, 이력은 새 항목만 추가)"""
+        self.upsert_many([(source, path)])
+
+    def upsert_many(self, items: Iterable[Tuple[Dict, Path]]) -> int:
+        """여러 원석을 한 트랜잭션으로 기록 [(원석, 파일 경로)], 기록한 수 반환"""
+        rows = []
+        events = []
+        for source, path in items:
+            rows.append(_row(source, self._relative(path)))
+            events.extend(
+                (source["id"], seq, event.get("timestamp"), event.get("action"), event.get("details"))
+                for seq, event in enumerate(source.get("history") or [])
+            )
+        if not rows:
+            return 0
+
+        placeholders = ", ".join("?" * (len(COLUMNS) + 1))
+        updates = ", ".join(f"{c} = excluded.{c}" for c in COLUMNS[1:] + ("data",))
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO sources ({', '.join(COLUMNS)}, data) VALUES ({placeholders}) "
+                f"ON CONFLICT (id) DO UPDATE SET {updates}",
+                rows,
+            )
+            self.conn.executemany("INSERT OR IGNORE INTO history VALUES (?, ?, ?, ?, ?)", events)
+        return len(rows)
+
+    def delete(self, source_id: str) -> None:
+        """원석 삭제 (이력 포함)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM sources WHERE id = ?", (source_id,))
+
+    # === 조회 ===
+
+    def get(self, source_id: str) -> Optional[Dict]:
+        """원석 JSON"""
+        row = self.conn.execute("SELECT data FROM sources WHERE id = ?", (source_id,)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def query(
+        self,
+        status: Optional[str] = None,
+        domain: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """조건에 맞는 원석 요약 (생성 시각 최신순, 시각은 ISO 문자열)"""
+        where = []
+        params = []
+        for column, op, value in [
+            ("status", "=", status),
+            ("domain", "=", domain),
+            ("created_at", ">=", since),
+            ("created_at", "<", until),
+        ]:
+            if value is not None:
+                where.append(f"{column} {op} ?")
+                params.append(value)
+
+        sql = f"SELECT {', '.join(COLUMNS)} FROM sources"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def counts(self, column: str = "status") -> Dict[str, int]:
+        """상태 또는 도메인별 원석 수"""
+        if column not in ("status", "domain", "input_type"):
+            raise ValueError(f"집계할 수 없는 열: {column}")
+        sql = f"SELECT {column} AS key, COUNT(*) AS n FROM sources GROUP BY {column}"
+        return {row["key"]: row["n"] for row in self.conn.execute(sql)}
+
+    def history(self, source_id: str) -> List[Dict]:
+        """원석 이력 (오래된 순)"""
+        sql = "SELECT timestamp, action, details FROM history WHERE source_id = ? ORDER BY seq"
+        return [dict(row) for row in self.conn.execute(sql, (source_id,))]
+
+    # === 가져오기/내보내기 ===
+
+    def import_files(self, files: Iterable[Path], batch_size: int = 500) -> int:
+        """원석 JSON 파일 가져오기 (batch_size개씩 한 트랜잭션), 가져온 수 반환"""
+        count = 0
+        batch = []
+        for f in files:
+            with open(f, "r", encoding="utf-8") as fp:
+                batch.append((json.load(fp), f))
+            if len(batch) >= batch_size:
+                count += self.upsert_many(batch)
+                batch = []
+        return count + self.upsert_many(batch)
+
+    def export(self, out_dir: Optional[Path] = None) -> int:
+        """저장된 원석을 원래 상대 경로 그대로 JSON 파일로 내보냄 (기본: 저장소 루트)"""
+        out_dir = out_dir or self.root
+        count = 0
+        for row in self.conn.execute("SELECT path, data FROM sources ORDER BY id"):
+            write_json(out_dir / row["path"], json.loads(row["data"]))
+            count += 1
+        return count
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+DTSLIB Publisher Core - Factory State Index
+원석 ID → 현재 위치/상태 색인
+
+process/state.json   스냅샷 (원석 ID → {"path", "status"})
+process/state.log    스냅샷 이후 변경 저널 (한 줄에 JSON 하나, 추가만 함)
+
+throw/process/publish는 저널에 한 줄만 덧붙이므로 원석 수와 무관하게 O(1)이고,
+로드는 스냅샷 + 저널 재생으로 끝난다. 저널이 스냅샷보다 커지면 compact()가
+잠금 아래에서 스냅샷을 다시 쓰고 저널을 비운다. 쓰다 만 마지막 줄은 무시한다.
+
+process/counters.json  status용 집계 카운터 (인박스/대기열/처리/도메인별 수)
+
+카운터는 throw/process/publish가 변경분만 잠금 아래에서 더하므로 status는
+파일 하나만 읽는다. 디렉토리를 직접 고친 경우 rebuild()로 다시 센다.
+"""
+
+import os
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from storage import dumps_json, file_lock, loads_json, read_json, write_json
+
+COMPACT_MIN_BYTES = 8192  # 저널이 이보다 작으면 스냅샷에 합치지 않음
+
+
+def _file_size(path: Path) -> int:
+    """파일 크기 (없으면 0)"""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+class SourceIndex:
+    """원석 위치/상태 색인 (스냅샷 + 추가 전용 저널)"""
+
+    def __init__(self, state_dir: Path, root: Path):
+        self.root = root
+        self.state_file = state_dir / "state.json"
+        self.journal_file = state_dir / "state.log"
+        self.lock_file = state_dir / "state.lock"
+        self._sources = None
+        self._journal_entries = 0
+
+    @property
+    def exists(self) -> bool:
+        """스냅샷 또는 저널 존재 여부"""
+        return self.state_file.exists() or self.journal_file.exists()
+
+    @property
+    def sources(self) -> Dict[str, Dict]:
+        """원석 ID → {"path", "status"} (최초 접근 시 로드)"""
+        if self._sources is None:
+            self._load()
+        return self._sources
+
+    def _load(self) -> None:
+        """스냅샷 로드 후 저널 재생"""
+        self._sources = read_json(self.state_file, {}).get("sources", {})
+        self._journal_entries = 0
+        if not self.journal_file.exists():
+            return
+
+        for line in self.journal_file.read_bytes().split(b"\n"):
+            if not line:
+                continue
+            try:
+                entry = loads_json(line)
+            except (json.JSONDecodeError, UnicodeDecodeError, ValueError):
+                # 중단된 쓰기로 잘린 줄
+                continue
+            self._apply(entry)
+            self._journal_entries += 1
+
+    def _apply(self, entry: Dict) -> None:
+        """저널 항목 하나 반영"""
+        if entry.get("deleted"):
+            self._sources.pop(entry["id"], None)
+        else:
+            self._sources[entry["id"]] = {"path": entry["path"], "status": entry["status"]}
+
+    def _append(self, *entries: Dict) -> None:
+        """저널에 항목 추가 (여러 개면 한 번의 쓰기로, 메모리 반영은 이미 로드된 경우만)"""
+        if self._sources is not None:
+            for entry in entries:
+                self._apply(entry)
+        with file_lock(self.lock_file):
+            with open(self.journal_file, "a+b") as f:
+                # 이전 쓰기가 줄 중간에서 끊겼으면 새 줄에서 시작
+                size = f.seek(0, os.SEEK_END)
+                if size:
+                    f.seek(size - 1)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+                f.write(b"".join(dumps_json(entry, compact=True) + b"\n" for entry in entries))
+                f.flush()
+                os.fsync(f.fileno())
+        self._journal_entries += len(entries)
+
+    def _write_snapshot(self) -> None:
+        """스냅샷 저장 후 저널 비우기 (잠금을 잡은 상태에서 호출)"""
+        write_json(self.state_file, {"version": "1.0.0", "sources": self._sources}, compact=True)
+        with open(self.journal_file, "wb") as f:
+            os.fsync(f.fileno())
+        self._journal_entries = 0
+
+    def _relative(self, path: Path) -> str:
+        """저장소 루트 기준 상대 경로"""
+        return Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+
+    # === 조회 ===
+
+    def get(self, source_id: str) -> Optional[Dict]:
+        """원석 상태 ({"path", "status"})"""
+        return self.sources.get(source_id)
+
+    def path(self, source_id: str) -> Optional[Path]:
+        """원석 파일 경로 (색인에 없으면 None)"""
+        entry = self.get(source_id)
+        return self.root / entry["path"] if entry else None
+
+    # === 변경 ===
+
+    def set(self, source_id: str, path: Path, status: str) -> None:
+        """원석 위치/상태 기록"""
+        self._append({"id": source_id, "path": self._relative(path), "status": status})
+
+    def set_many(self, entries: List[Tuple[str, Path, str]]) -> None:
+        """여러 원석의 위치/상태를 한 번에 기록 [(원석 ID, 경로, 상태)]"""
+        if entries:
+            self._append(*(
+                {"id": source_id, "path": self._relative(path), "status": status}
+                for source_id, path, status in entries
+            ))
+
+    def remove(self, source_id: str) -> None:
+        """원석 삭제 기록"""
+        if source_id in self.sources:
+            self._append({"id": source_id, "deleted": True})
+
+    def compact(self, force: bool = False) -> bool:
+        """저널을 스냅샷에 합치기 (저널이 스냅샷보다 클 때만, force면 항상)"""
+        if not force:
+            if self._sources is None:
+                # 로드하지 않았으면 파일 크기로 비교 (스냅샷을 읽지 않음)
+                if _file_size(self.journal_file) <= max(_file_size(self.state_file), COMPACT_MIN_BYTES):
+                    return False
+            elif self._journal_entries <= max(len(self._sources), 100):
+                return False
+
+        with file_lock(self.lock_file):
+            # 다른 프로세스가 추가한 저널까지 반영한 뒤 스냅샷 저장
+            self._load()
+            self._write_snapshot()
+        return True
+
+    def rebuild(self, entries: Dict[str, Tuple[Path, str]]) -> None:
+        """디렉토리 스캔 결과로 색인 재생성 (원석 ID → (파일 경로, 상태))"""
+        self._sources = {
+            source_id: {"path": self._relative(path), "status": status}
+            for source_id, (path, status) in entries.items()
+        }
+        with file_lock(self.lock_file):
+            self._write_snapshot()
+
+
+class CounterStore:
+    """집계 카운터 ("inbox", "routing.parksy" 같은 키 → 수, 변경분은 저장 전까지 메모리에 누적)"""
+
+    def __init__(self, state_dir: Path):
+        self.counters_file = state_dir / "counters.json"
+        self.lock_file = state_dir / "counters.lock"
+        self._pending = Counter()
+
+    @property
+    def exists(self) -> bool:
+        """카운터 파일 존재 여부"""
+        return self.counters_file.exists()
+
+    def load(self) -> Dict[str, int]:
+        """저장된 카운터 (저장되지 않은 변경분 포함)"""
+        counters = Counter(read_json(self.counters_file, {}).get("counters", {}))
+        counters.update(self._pending)
+        return dict(counters)
+
+    def add(self, key: str, amount: int = 1) -> None:
+        """카운터 증감"""
+        self._pending[key] += amount
+
+    def merge(self, deltas: Dict[str, int]) -> None:
+        """여러 카운터 변경분 합치기"""
+        self._pending.update(deltas)
+
+    def save(self) -> None:
+        """변경분을 파일에 합산 저장 (동시 실행 중인 다른 프로세스의 변경도 보존)"""
+        if not any(self._pending.values()):
+            self._pending = Counter()
+            return
+
+        with file_lock(self.lock_file):
+            counters = Counter(read_json(self.counters_file, {}).get("counters", {}))
+            counters.update(self._pending)
+            write_json(self.counters_file, {"version": "1.0.0", "counters": dict(counters)}, compact=True)
+        self._pending = Counter()
+
+    def rebuild(self, counters: Dict[str, int]) -> None:
+        """디렉토리를 다시 센 결과로 카운터 교체"""
+        self._pending = Counter()
+        with file_lock(self.lock_file):
+            write_json(self.counters_file, {"version": "1.0.0", "counters": dict(counters)}, compact=True)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+DTSLIB Publisher Core - ID Allocator
+키(예: 날짜)별로 증가하는 일련번호를 파일에 저장해 두고 잠금 아래에서 할당한다.
+
+디렉토리를 훑어 개수를 세는 대신 카운터 하나만 읽고 쓰므로 할당 비용이
+파일 수와 무관하고, 동시에 여러 프로세스가 할당해도 번호가 겹치지 않는다.
+키를 처음 쓸 때만 seed 함수로 기존 최대 번호를 구해 이어서 할당한다.
+
+사용법:
+    from id_allocator import SequenceAllocator
+
+    ids = SequenceAllocator(PROCESS / "sequence.json", seed=max_existing_seq)
+    seq = ids.allocate("20250116")            # 다음 번호 1개
+    first = ids.allocate("20250116", count=50)  # 연속 50개 예약 (first ~ first+49)
+"""
+
+from pathlib import Path
+from typing import Callable, Optional
+
+from storage import file_lock, read_json, write_json
+
+
+class SequenceAllocator:
+    """키별 일련번호 할당기 (파일 잠금으로 프로세스 간 중복 없음)"""
+
+    def __init__(self, state_file: Path, seed: Optional[Callable[[str], int]] = None):
+        self.state_file = Path(state_file)
+        self.lock_file = self.state_file.with_suffix(".lock")
+        self.seed = seed
+
+    def allocate(self, key: str, count: int = 1) -> int:
+        """연속된 번호 count개를 예약하고 첫 번호 반환 (번호는 1부터)"""
+        if count < 1:
+            raise ValueError(f"count는 1 이상이어야 함: {count}")
+
+        with file_lock(self.lock_file):
+            counters = read_json(self.state_file, {}).get("counters", {})
+
+            last = counters.get(key)
+            if last is None:
+                last = self.seed(key) if self.seed else 0
+
+            counters[key] = last + count
+            write_json(self.state_file, {"version": "1.0.0", "counters": counters}, compact=True)
+
+        return last + 1
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+DTSLIB Publisher Core - Inbox Watch
+인박스 폴더에 새 원석 파일이 생기는 것을 감시 (factory.py watch에서 사용)
+
+- Linux에서는 ctypes로 inotify를 직접 호출한다 (추가 패키지 없음). 원석은
+  임시 파일 → rename으로 저장되므로 IN_MOVED_TO / IN_CLOSE_WRITE만 본다.
+- inotify를 쓸 수 없으면 (다른 OS, 감시 한도 초과 등) 주기적으로 폴더를
+  훑어 새 파일을 찾는 방식으로 대체한다.
+- WatchMetrics: 처리 수, 대기열 길이, 던진 시각 → 라우팅 시각 지연
+
+사용법:
+    watcher = create_watcher([INBOX / "text", ...])
+    existing = watcher.scan()         # 시작 시 이미 있는 원석
+    new_files = watcher.wait(1.0)     # 최대 1초 기다려 새 원석 경로 집합
+"""
+
+import os
+import sys
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from storage import write_json
+
+POLL_INTERVAL = 1.0      # 폴링 대체 시 폴더를 훑는 간격 (초)
+LATENCY_WINDOW = 1000    # 지연 통계에 쓰는 최근 원석 수
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def is_source_file(name: str) -> bool:
+    """원석 파일 이름인지 (저장 중인 임시 파일 제외)"""
+    return name.startswith("src-") and name.endswith(".json")
+
+
+class PollingWatcher:
+    """폴더를 주기적으로 훑어 새 원석 찾기"""
+
+    backend = "polling"
+
+    def __init__(self, dirs: Iterable[Path], interval: float = POLL_INTERVAL):
+        self.dirs = list(dirs)
+        self.interval = interval
+        self._seen = self.scan()
+
+    def scan(self) -> Set[Path]:
+        """현재 있는 원석 파일 전체"""
+        found = set()
+        for directory in self.dirs:
+            try:
+                entries = os.scandir(directory)
+            except FileNotFoundError:
+                continue
+            with entries:
+                found.update(Path(e.path) for e in entries if is_source_file(e.name))
+        return found
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """최대 timeout초 기다린 뒤 지난 스캔 이후 새로 생긴 원석 (None이면 한 간격)"""
+        time.sleep(self.interval if timeout is None else min(self.interval, timeout))
+        current = self.scan()
+        new_files = current - self._seen
+        self._seen = current
+        return new_files
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher(PollingWatcher):
+    """inotify (Linux, ctypes) 기반 감시"""
+
+    backend = "inotify"
+
+    def __init__(self, dirs: Iterable[Path]):
+        self.dirs = list(dirs)
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+
+        self._dirs_by_wd = {}
+        try:
+            for directory in self.dirs:
+                wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO)
+                if wd < 0:
+                    errno = ctypes.get_errno()
+                    raise OSError(errno, f"inotify_add_watch 실패: {directory} ({os.strerror(errno)})")
+                self._dirs_by_wd[wd] = Path(directory)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """최대 timeout초 기다려 새로 저장된 원석 (None이면 이벤트가 올 때까지)"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        new_files = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                wd, mask, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b"\0").decode("utf-8", "replace")
+                offset += name_len
+                if mask & IN_Q_OVERFLOW:
+                    # 이벤트 유실 → 폴더 전체를 다시 봄
+                    new_files.update(self.scan())
+                elif wd in self._dirs_by_wd and is_source_file(name):
+                    new_files.add(self._dirs_by_wd[wd] / name)
+        return new_files
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(dirs: Iterable[Path], poll: bool = False, interval: float = POLL_INTERVAL):
+    """inotify 감시기 (쓸 수 없거나 poll이면 폴링 감시기)"""
+    dirs = list(dirs)
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(dirs)
+        except (OSError, AttributeError) as e:
+            print(f"[WARN] inotify 사용 불가, 폴링으로 대체 - {e}")
+    return PollingWatcher(dirs, interval)
+
+
+def _parse_time(value: Optional[str]) -> Optional[float]:
+    """ISO 시각 ("...Z") → epoch 초"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class WatchMetrics:
+    """감시 모드 지표 (처리 수, 대기열 길이, 던진 시각 → 라우팅 시각 지연)"""
+
+    def __init__(self, backend: str, window: int = LATENCY_WINDOW):
+        self.backend = backend
+        self.started_at = datetime.utcnow().isoformat() + "Z"
+        self.batches = 0
+        self.processed = 0
+        self.failed = 0
+        self.queue_depth = 0
+        self.latencies = deque(maxlen=window)
+
+    def record_batch(self, sources: List[Dict], failed: int, queue_depth: int) -> None:
+        """배치 하나의 결과 반영"""
+        self.batches += 1
+        self.processed += len(sources)
+        self.failed += failed
+        self.queue_depth = queue_depth
+        for source in sources:
+            thrown = _parse_time(source.get("createdAt"))
+            routed = _parse_time(source.get("processing", {}).get("processedAt"))
+            if thrown is not None and routed is not None:
+                self.latencies.append(max(routed - thrown, 0.0))
+
+    def latency(self) -> Dict:
+        """최근 원석의 지연 통계 (초)"""
+        if not self.latencies:
+            return {"count": 0}
+        ordered = sorted(self.latencies)
+        return {
+            "count": len(ordered),
+            "last": self.latencies[-1],
+            "avg": sum(ordered) / len(ordered),
+            "p50": ordered[len(ordered) // 2],
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            "max": ordered[-1],
+        }
+
+    def snapshot(self) -> Dict:
+        """현재 지표"""
+        return {
+            "backend": self.backend,
+            "startedAt": self.started_at,
+            "updatedAt": datetime.utcnow().isoformat() + "Z",
+            "batches": self.batches,
+            "processed": self.processed,
+            "failed": self.failed,
+            "queueDepth": self.queue_depth,
+            "latency": self.latency(),
+        }
+
+    def save(self, path: Path) -> None:
+        """지표 파일 저장 (status 명령 등에서 읽음)"""
+        write_json(path, self.snapshot())
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+DTSLIB Publisher Core - Keyword Extractor
+한국어 키워드 추출 (조사/어미 제거 + 불용어 + TF-IDF)
+
+- 어절에서 어미("했다", "하는" 등) → 조사("을", "에서" 등) → 복수 접미사("들")
+  순으로 떼어 내 "생각을"/"생각이"/"생각했다"를 모두 "생각"으로 센다.
+- 명사 끝 글자와 겹치는 한 글자 조사("이", "의", "가" 등)는 뗀 어간이 같은 글이나
+  DF 표에 따로 나올 때만 뗀다 ("고양이", "민주주의"가 "고양", "민주주"가 되지 않게).
+- 문서 빈도(DF) 표는 data/factory/keyword-df.json에 저장하고, 새 원석을 처리할
+  때마다 그 문서의 단어 집합만 더한다 (저장 시 잠금 아래에서 파일과 병합).
+- 점수는 TF × IDF, 상위 k개는 heapq로 고른다.
+
+사용법:
+    extractor = KeywordExtractor(DF_FILE)
+    keywords = extractor.extract(text)   # 상위 10개, 문서를 DF에 추가
+    extractor.save()                     # 누적된 DF 변경분 저장
+
+    python -m doctest scripts/keyword_extractor.py   # 어간 추출 예시 확인
+"""
+
+import re
+import math
+import heapq
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from storage import file_lock, read_json, write_json
+
+WORD_PATTERN = re.compile(r"[가-힣]+")
+DF_VERSION = "1.1.0"  # 어간 추출 규칙이 바뀌면 올림 (이전 버전 표는 다시 만듦)
+MIN_STEM_LENGTH = 2
+
+ENDINGS = [
+    "하다", "한다", "했다", "하는", "하고", "해서", "하며", "하면", "하게", "했던", "합니다", "했습니다",
+    "되다", "된다", "됐다", "되는", "되고", "되어", "돼서", "됩니다",
+    "이다", "였다", "이었다", "입니다", "이며", "이고",
+    "적인", "적으로", "스럽다", "스러운", "롭다", "로운",
+]
+
+PARTICLES = [
+    "에서부터", "으로부터", "로부터", "에게서", "한테서",
+    "에서", "에게", "한테", "께서", "으로", "로서", "로써", "처럼", "보다", "마다",
+    "까지", "부터", "조차", "마저", "밖에", "이나", "이든", "이랑", "하고", "이라", "라는", "이란",
+    "은", "는", "이", "가", "을", "를", "의", "에", "도", "만", "와", "과", "로", "랑", "나", "야",
+]
+
+SUFFIXES = ["들"]
+
+# 명사 끝 글자로도 흔한 한 글자 조사 (뗀 어간이 따로 쓰인 적이 있을 때만 뗌)
+AMBIGUOUS_PARTICLES = {"이", "의", "가", "도", "나", "과", "와", "로", "야", "만", "랑"}
+
+# 위 조사로 끝나지만 그 자체가 명사인 단어 (따로 쓰인 어간이 있어도 떼지 않음)
+NOUN_EXCEPTIONS = {
+    "고양이", "어린이", "원숭이", "오토바이", "바나나", "어머나",
+    "민주주의", "자본주의", "사회주의", "공산주의", "개인주의", "자유주의", "회의주의",
+    "예술가", "전문가", "작곡가", "소설가", "사진가", "평론가", "정치가", "건축가", "작사가",
+    "한반도", "제주도", "대학로",
+}
+
+STOPWORDS = {
+    "그리고", "그러나", "하지만", "그래서", "그런데", "그러면", "또한", "또는", "그냥", "정말",
+    "너무", "아주", "매우", "조금", "많이", "이런", "그런", "저런", "어떤", "무엇", "이것",
+    "그것", "저것", "여기", "거기", "저기", "우리", "저희", "자신", "때문", "대한", "위해",
+    "통해", "있다", "없다", "있는", "없는", "같다", "같은", "이렇게", "그렇게", "어떻게",
+    "지금", "다시", "모든", "여러", "하나", "경우", "정도", "부분",
+    "했다", "한다", "하는", "했던", "해서", "하고", "된다", "되는", "있었다", "없었다",
+}
+
+
+def _by_length(endings: List[str]) -> List[tuple]:
+    """[(길이, 집합)] 긴 것부터 (예: "에서부터"가 "부터"보다 먼저)"""
+    lengths = sorted({len(e) for e in endings}, reverse=True)
+    return [(n, {e for e in endings if len(e) == n}) for n in lengths]
+
+
+STRIP_STAGES = [_by_length(ENDINGS), _by_length(PARTICLES), _by_length(SUFFIXES)]
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """어절에서 어미 → 조사 → 접미사를 하나씩 떼어 냄 (남는 어간이 너무 짧으면 그대로)
+
+    AMBIGUOUS_PARTICLES는 여기서 떼지 않는다 (tokenize가 문맥을 보고 뗌).
+
+    >>> [stem(w) for w in ["생각을", "생각했다", "사람들은", "학교에서부터"]]
+    ['생각', '생각', '사람', '학교']
+    >>> [stem(w) for w in ["고양이", "민주주의", "바나나", "오토바이"]]
+    ['고양이', '민주주의', '바나나', '오토바이']
+    """
+    for stage in STRIP_STAGES:
+        for n, endings in stage:
+            if (len(word) - n >= MIN_STEM_LENGTH and word[-n:] in endings
+                    and word[-n:] not in AMBIGUOUS_PARTICLES):
+                word = word[:-n]
+                break
+    return word
+
+
+def tokenize(text: str, known: Optional[Callable[[str], bool]] = None) -> List[str]:
+    """한국어 어절 → 어간 목록 (불용어/한 글자 제외, 등장 순서 유지)
+
+    명사 끝 글자와 겹치는 한 글자 조사는 뗀 어간이 같은 글에 나오거나
+    known(어간)이 참일 때만 뗀다 (NOUN_EXCEPTIONS는 항상 그대로).
+
+    >>> tokenize("사람이 사람을 만났다")
+    ['사람', '사람', '만났다']
+    >>> tokenize("고양이 고양이가 민주주의 오토바이 바나나")
+    ['고양이', '고양이', '민주주의', '오토바이', '바나나']
+    >>> tokenize("예술가 예술을 사랑한다")
+    ['예술가', '예술', '사랑']
+    >>> tokenize("생각이 깊다", known={"생각"}.__contains__)
+    ['생각', '깊다']
+    """
+    stems = [stem(word) for word in WORD_PATTERN.findall(text)]
+    seen = set(stems)
+    terms = []
+    for term in stems:
+        if (term[-1] in AMBIGUOUS_PARTICLES and len(term) - 1 >= MIN_STEM_LENGTH
+                and term not in NOUN_EXCEPTIONS):
+            rest = stem(term[:-1])
+            if rest in seen or (known is not None and known(rest)):
+                term = rest
+        if len(term) >= MIN_STEM_LENGTH and term not in STOPWORDS:
+            terms.append(term)
+    return terms
+
+
+class KeywordExtractor:
+    """TF-IDF 키워드 추출기 (문서 빈도 표는 증분 갱신)"""
+
+    def __init__(self, df_file: Path):
+        self.df_file = df_file
+        self.lock_file = df_file.with_suffix(".lock")
+        self._table = None
+        self._pending_docs = 0
+        self._pending_df = Counter()
+
+    @property
+    def table(self) -> Dict:
+        """저장된 DF 표 (최초 접근 시 로드)"""
+        if self._table is None:
+            data = read_json(self.df_file, {})
+            self._table = {
+                "version": data.get("version"),
+                "documents": data.get("documents", 0),
+                "df": Counter(data.get("df", {})),
+            }
+        return self._table
+
+    @property
+    def outdated(self) -> bool:
+        """DF 표가 없거나 이전 어간 추출 규칙으로 만든 것인지"""
+        return self.table.get("version") != DF_VERSION
+
+    @property
+    def documents(self) -> int:
+        """문서 수 (저장되지 않은 변경분 포함)"""
+        return self.table["documents"] + self._pending_docs
+
+    def df(self, term: str) -> int:
+        """단어가 나온 문서 수 (저장되지 않은 변경분 포함)"""
+        return self.table["df"].get(term, 0) + self._pending_df.get(term, 0)
+
+    def add_document(self, terms: Iterable[str]) -> None:
+        """문서 하나의 단어 집합을 DF에 반영 (저장 전까지 메모리에 누적)"""
+        self._pending_docs += 1
+        self._pending_df.update(set(terms))
+
+    def top_k(self, terms: List[str], k: int = 10) -> List[str]:
+        """TF × IDF 상위 k개 (동점이면 먼저 나온 단어)"""
+        tf = Counter(terms)
+        first_seen = {}
+        for i, term in enumerate(terms):
+            first_seen.setdefault(term, i)
+
+        documents = self.documents
+
+        def score(term: str) -> tuple:
+            idf = math.log((documents + 1) / (self.df(term) + 1)) + 1
+            return tf[term] * idf, -first_seen[term]
+
+        return heapq.nlargest(k, tf, key=score)
+
+    def extract(self, text: str, k: int = 10, learn: bool = True) -> List[str]:
+        """본문 키워드 추출 (learn이면 이 문서를 DF에 추가한 뒤 점수 계산)"""
+        terms = tokenize(text, known=lambda term: self.df(term) > 0)
+        if learn:
+            self.add_document(terms)
+        return self.top_k(terms, k)
+
+    def pending(self) -> Dict:
+        """저장되지 않은 DF 변경분 (프로세스 간 전달용)"""
+        return {"documents": self._pending_docs, "df": dict(self._pending_df)}
+
+    def take_pending(self) -> Dict:
+        """저장되지 않은 DF 변경분을 꺼내고 비움 (워커가 원석마다 변경분만 넘길 때)"""
+        delta = self.pending()
+        self._pending_docs = 0
+        self._pending_df = Counter()
+        return delta
+
+    def use_table(self, table: Dict) -> None:
+        """이미 읽은 DF 표 사용 (부모 프로세스의 스냅샷을 워커에서 다시 읽지 않음)"""
+        self._table = table
+
+    def merge(self, delta: Dict) -> None:
+        """다른 프로세스의 DF 변경분 합치기"""
+        self._pending_docs += delta.get("documents", 0)
+        self._pending_df.update(delta.get("df", {}))
+
+    def save(self) -> None:
+        """변경분을 파일에 병합 저장 (동시 실행 중인 다른 프로세스의 변경도 보존)"""
+        if not self._pending_docs:
+            return
+
+        with file_lock(self.lock_file):
+            data = read_json(self.df_file, {})
+            df = Counter(data.get("df", {}))
+            df.update(self._pending_df)
+            documents = data.get("documents", 0) + self._pending_docs
+            write_json(self.df_file, {"version": DF_VERSION, "documents": documents, "df": dict(df)}, compact=True)
+
+        self._table = {"version": DF_VERSION, "documents": documents, "df": df}
+        self._pending_docs = 0
+        self._pending_df = Counter()
+
+    def rebuild(self, texts: Iterable[str]) -> int:
+        """전체 문서로 DF 표 재생성 (처리한 문서 수 반환)"""
+        self._table = {"documents": 0, "df": Counter()}
+        self._pending_docs = 0
+        self._pending_df = Counter()
+        for text in texts:
+            self.add_document(tokenize(text, known=lambda term: term in self._pending_df))
+
+        with file_lock(self.lock_file):
+            write_json(self.df_file, {
+                "version": DF_VERSION,
+                "documents": self._pending_docs,
+                "df": dict(self._pending_df),
+            }, compact=True)
+
+        self._table = {"version": DF_VERSION, "documents": self._pending_docs, "df": self._pending_df}
+        count = self._pending_docs
+        self._pending_docs = 0
+        self._pending_df = Counter()
+        return count
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+DTSLIB Publisher Core - Keyword Router
+Aho–Corasick 다중 패턴 매칭으로 모든 그룹(도메인)의 키워드를 한 번에 세기
+
+키워드마다 `kw in text`로 본문을 훑으면 O(키워드 수 × 본문 길이)지만,
+오토마톤은 본문을 한 번만 지나가며 모든 키워드를 찾는다. 점수는 기존과
+같이 "본문에 나타난 서로 다른 키워드 수"이고, 같은 키워드가 여러 그룹에
+있으면 각 그룹에 모두 센다.
+
+키워드에 쓰이지 않는 문자(공백 등)를 넘는 키워드는 없으므로, 본문을 키워드
+문자로만 이루어진 구간으로 나눠 구간마다 오토마톤을 돌리고 그 결과를
+캐시한다. 자연어에서는 같은 어절이 반복되므로 대부분 캐시에서 끝난다.
+
+사용법:
+    from keyword_router import KeywordRouter, load_keyword_groups
+
+    groups = load_keyword_groups(PIPELINES / "routing-keywords.json", DEFAULT_GROUPS)
+    router = KeywordRouter(groups)
+    router.score("오늘 생각한 이론")   # {"parksy": 2, "eae": 1, "dtslib": 0}
+    router.score_matrix(texts)         # 문서 × 그룹 점수 행렬 (NumPy 있으면 ndarray)
+"""
+
+import re
+from collections import deque
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+from storage import read_json
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RUN_CACHE_SIZE = 100000  # 구간 → 키워드 캐시 최대 항목 수 (넘으면 비움)
+BATCH_MIN_DOCS = 64      # 이보다 적은 문서는 행렬 집계 비용이 더 커서 문서별로 처리
+
+
+class KeywordRouter:
+    """그룹별 키워드 사전을 하나의 오토마톤으로 컴파일"""
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        self.groups = list(groups)
+        self.keywords = []  # 키워드 번호 → (그룹 번호, 키워드)
+
+        # 1) 트라이 구성
+        goto = [{}]
+        outputs = [[]]
+        for group_index, words in enumerate(groups.values()):
+            for word in dict.fromkeys(w.lower() for w in words if w):
+                keyword_id = len(self.keywords)
+                self.keywords.append((group_index, word))
+                state = 0
+                for ch in word:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][ch] = nxt
+                        goto.append({})
+                        outputs.append([])
+                    state = nxt
+                outputs[state].append(keyword_id)
+
+        # 2) 실패 링크 (BFS, 얕은 상태의 출력이 먼저 확정됨)
+        fail = [0] * len(goto)
+        queue = deque()
+        for nxt in goto[0].values():
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0) if state else 0
+                outputs[nxt].extend(outputs[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(o) for o in outputs]
+
+        # 3) 키워드 문자 구간 패턴
+        alphabet = sorted({ch for _, word in self.keywords for ch in word})
+        self._runs = re.compile("[" + "".join(re.escape(ch) for ch in alphabet) + "]+") if alphabet else None
+        self._run_cache = {}
+
+    def _scan_run(self, run: str) -> Tuple[int, ...]:
+        """키워드 문자 구간 하나를 오토마톤으로 스캔"""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found = set()
+        state = 0
+        for ch in run:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return tuple(sorted(found))
+
+    def find(self, text: str) -> Set[int]:
+        """본문에 나타난 키워드 번호 집합"""
+        if self._runs is None:
+            return set()
+
+        runs = set(self._runs.findall(text.lower()))
+        cache = self._run_cache
+        if len(cache) + len(runs) > RUN_CACHE_SIZE:
+            cache.clear()
+        for run in runs.difference(cache):
+            cache[run] = self._scan_run(run)
+        return set(chain.from_iterable(map(cache.__getitem__, runs)))
+
+    def score(self, text: str) -> Dict[str, int]:
+        """그룹별 점수 (나타난 서로 다른 키워드 수)"""
+        counts = [0] * len(self.groups)
+        for keyword_id in self.find(text):
+            counts[self.keywords[keyword_id][0]] += 1
+        return dict(zip(self.groups, counts))
+
+    def score_matrix(self, texts: List[str]):
+        """여러 문서의 그룹별 점수 행렬 (문서 × 그룹)
+
+        문서별로 찾은 키워드를 (문서, 키워드) 희소 좌표로 모은 뒤, NumPy가 있으면
+        키워드 → 그룹 사상과 bincount로 한 번에 집계해 int64 ndarray를 돌려준다.
+        NumPy가 없으면 같은 값을 리스트의 리스트로 돌려준다.
+        """
+        group_count = len(self.groups)
+        found = [self.find(text) for text in texts]
+
+        if np is None:
+            counts = [[0] * group_count for _ in texts]
+            for i, keyword_ids in enumerate(found):
+                for keyword_id in keyword_ids:
+                    counts[i][self.keywords[keyword_id][0]] += 1
+            return counts
+
+        sizes = np.fromiter(map(len, found), dtype=np.int64, count=len(found))
+        doc_index = np.repeat(np.arange(len(texts), dtype=np.int64), sizes)
+        keyword_ids = np.fromiter(chain.from_iterable(found), dtype=np.int64, count=int(sizes.sum()))
+        keyword_group = np.array([group for group, _ in self.keywords], dtype=np.int64)
+        cells = doc_index * group_count + keyword_group[keyword_ids]
+        return np.bincount(cells, minlength=len(texts) * group_count).reshape(len(texts), group_count)
+
+    def matches(self, text: str) -> Dict[str, List[str]]:
+        """그룹별로 나타난 키워드 목록"""
+        result = {group: [] for group in self.groups}
+        for keyword_id in sorted(self.find(text)):
+            group_index, word = self.keywords[keyword_id]
+            result[self.groups[group_index]].append(word)
+        return result
+
+
+def load_keyword_groups(config_file: Path, defaults: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """기본 키워드에 설정 파일의 키워드를 더함
+
+    설정 파일 형식: {"domains": {"parksy": ["..."], ...}}
+    기본값에 없는 그룹은 라우팅 대상이 아니므로 경고 후 무시한다.
+    """
+    groups = {name: list(words) for name, words in defaults.items()}
+    for name, words in read_json(config_file, {}).get("domains", {}).items():
+        if name not in groups:
+            print(f"[WARN] 알 수 없는 라우팅 그룹 무시: {name} ({config_file.name})")
+            continue
+        known = set(groups[name])
+        groups[name].extend(w for w in words if w not in known)
+    return groups
@@ -6,8 +6,10 @@ PARKSY Publisher Platform - Media Pipeline
 사용법:
     python scripts/media_pipeline.py --input content.md --persona Philosopher-Parksy
     python scripts/media_pipeline.py --batch /path/to/content/
+    python scripts/media_pipeline.py --batch /path/to/content/ --jobs 4
 """
 
+import io
 import os
 import sys
 import json
@@ -15,14 +17,27 @@ import re
 import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterable, List, TextIO, Union
+
+from storage import dumps_json, loads_json, read_json, write_json
 import hashlib
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 # === 설정 ===
 
-DATA_DIR = Path(__file__).parent.parent / "data"
+ROOT_DIR = Path(__file__).parent.parent
+DATA_DIR = ROOT_DIR / "data"
 PUB_DIR = DATA_DIR / "publications"
-API_DIR = Path(__file__).parent.parent / "api" / "v1"
+API_DIR = ROOT_DIR / "api" / "v1"
+INDEX_FILE = PUB_DIR / "index.json"
+INDEX_MANIFEST_FILE = PUB_DIR / "index-manifest.json"
+INDEX_VERSION = "2.0.0"  # 2.x: 요약 레코드만 저장 (본문은 개별 파일)
+API_SHARD_DIR = API_DIR / "publications"
+API_PER_PAGE = 20
+SOURCE_CACHE_FILE = DATA_DIR / "cache" / "media-sources.json"
+VIDEO_INDEX_NAME = "video-index.json"
 
 PERSONAS = [
     "Philosopher-Parksy",
@@ -44,12 +59,320 @@ PUBLICATION_TYPES = [
     "listening-guide",
 ]
 
+# 미디어 링크: YouTube(watch/youtu.be/embed) · Spotify(URL/URI) · 이미지를 한 번에 스캔
+MEDIA_LINK_PATTERN = re.compile(
+    r"(?P<youtube>(?:https?://)?(?:www\.)?"
+    r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)(?P<yt_id>[A-Za-z0-9_-]{11}))"
+    r"|(?P<spotify>(?:https?://)?open\.spotify\.com/(?P<sp_type>track|album|playlist|artist)/(?P<sp_id>[A-Za-z0-9]+)"
+    r"|spotify:(?P<sp_uri_type>track|album|playlist|artist):(?P<sp_uri_id>[A-Za-z0-9]+))"
+    r"|(?P<image>!\[.*?\]\((?P<img_url>.+?)\))"
+)
+
+TITLE_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+
+# 프런트매터에서 리스트로 읽는 키 (나머지는 "[...]"도 문자열 그대로)
+LIST_KEYS = {"tags"}
+
+
+def read_front_matter(fp: TextIO) -> str:
+    """여는 --- 다음부터 닫는 --- 까지 읽어 프런트매터 원문 반환 (닫는 줄 제외)"""
+    lines = []
+    for line in fp:
+        if line.strip() == "---":
+            break
+        lines.append(line)
+    return "".join(lines)
+
+
+def parse_front_matter(text: str) -> Dict:
+    """프런트매터 파싱
+
+    `key: value` 외에 LIST_KEYS(tags)는 YAML 스타일 리스트(`[a, b]` 인라인,
+    `- a` 블록)를 지원한다. 그 밖의 키는 `title: [Remastered]`처럼 대괄호가
+    있어도 문자열로 둔다.
+    """
+    metadata = {}
+    list_key = None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+
+        if list_key and stripped.startswith("- "):
+            metadata[list_key].append(unquote(stripped[2:]))
+            continue
+
+        list_key = None
+        if ":" not in line:
+            continue
+
+        key, value = line.split(":", 1)
+        key, value = key.strip(), value.strip()
+
+        if key not in LIST_KEYS:
+            metadata[key] = unquote(value)
+        elif not value:
+            # 다음 줄부터 블록 리스트가 올 수 있음
+            metadata[key] = []
+            list_key = key
+        elif value.startswith("[") and value.endswith("]"):
+            metadata[key] = [unquote(v) for v in value[1:-1].split(",") if v.strip()]
+        else:
+            metadata[key] = unquote(value)
+
+    # 값 없이 끝난 키는 기존처럼 빈 문자열
+    for key, value in metadata.items():
+        if value == []:
+            metadata[key] = ""
+
+    return metadata
+
+
+def unquote(value: str) -> str:
+    """따옴표 제거"""
+    return value.strip().strip('"').strip("'")
+
+
+def summarize_publication(publication: Dict) -> Dict:
+    """요약 레코드 생성 (본문 제외, 미디어는 ID만)"""
+    content = publication.get("content") or {}
+    media = publication.get("media") or {}
+    series = publication.get("series") or {}
+    return {
+        "id": publication.get("id"),
+        "title": publication.get("title"),
+        "subtitle": publication.get("subtitle", ""),
+        "type": publication.get("type"),
+        "status": publication.get("status"),
+        "persona": publication.get("persona"),
+        "excerpt": content.get("excerpt", ""),
+        "media": {
+            "youtube": [v.get("videoId") for v in media.get("youtube", [])],
+            "spotify": [s.get("spotifyId") for s in media.get("spotify", [])],
+        },
+        "cover": next(iter(media.get("images") or []), None),
+        "series": series.get("id"),
+        "tags": publication.get("tags", []),
+        "createdAt": publication.get("createdAt"),
+        "updatedAt": publication.get("updatedAt"),
+        "publishedAt": publication.get("publishedAt"),
+        "source": f"/data/publications/{publication.get('id')}.json",
+    }
+
+
+def shard_slug(value: str) -> str:
+    """샤드 디렉토리 이름 (한글 태그 허용)"""
+    return re.sub(r"[^\w-]+", "-", str(value).lower()).strip("-") or "_"
+
+
+def shard_slugs(values: Iterable[str]) -> Dict[str, str]:
+    """값 → 샤드 디렉토리 이름
+
+    보통은 shard_slug 그대로이고, "C++"와 "c", "a b"와 "a-b"처럼 같은 이름이
+    되는 값이 둘 이상일 때만 이름과 다른 값에 값의 해시를 붙여 구분한다.
+    """
+    groups = {}
+    for value in values:
+        groups.setdefault(shard_slug(value), []).append(value)
+
+    slugs = {}
+    for slug, group in groups.items():
+        for value in group:
+            if len(group) == 1 or str(value) == slug:
+                slugs[value] = slug
+            else:
+                slugs[value] = f"{slug}-{hashlib.md5(str(value).encode('utf-8')).hexdigest()[:8]}"
+    return slugs
+
+
+def write_api_file(path: Path, data: Dict) -> bool:
+    """API 파일 저장 (생성 시각 외에 바뀐 것이 없으면 건너뜀), 썼으면 True"""
+    if path.exists():
+        raw = path.read_bytes()
+        try:
+            previous_generated = loads_json(raw).get("meta", {}).get("generatedAt")
+        except (json.JSONDecodeError, UnicodeDecodeError, ValueError, AttributeError):
+            previous_generated = None
+        if previous_generated:
+            unchanged = {**data, "meta": {**data["meta"], "generatedAt": previous_generated}}
+            if dumps_json(unchanged) == raw:
+                return False
+    write_json(path, data)
+    return True
+
+
+def api_path(path: Path) -> str:
+    """로컬 경로 → 사이트 기준 URL 경로"""
+    return "/api/v1/" + path.relative_to(API_DIR).as_posix()
+
+
+def build_api_page(items: List[Dict], page: int, total_pages: int, base: str, generated_at: str) -> Dict:
+    """페이지 응답 객체 생성"""
+    start = (page - 1) * API_PER_PAGE
+    return {
+        "success": True,
+        "data": {
+            "publications": items[start:start + API_PER_PAGE],
+            "total": len(items),
+            "page": page,
+            "perPage": API_PER_PAGE,
+            "totalPages": total_pages,
+            "next": f"{base}/page-{page + 1}.json" if page < total_pages else None,
+            "prev": f"{base}/page-{page - 1}.json" if page > 1 else None,
+        },
+        "meta": {
+            "generatedAt": generated_at,
+            "source": "/data/publications/index.json",
+        },
+    }
+
+
+class PublicationStore:
+    """출판물 조회 (요약 인덱스 + 본문 지연 로드)"""
+
+    def __init__(self, pub_dir: Optional[Path] = None):
+        self.pub_dir = pub_dir or PUB_DIR
+        self._summaries = None
+        self._publications = {}
+
+    def summaries(self) -> List[Dict]:
+        """요약 인덱스 로드 (최초 1회)"""
+        if self._summaries is None:
+            items = read_json(self.pub_dir / "index.json", {}).get("items", [])
+            # 이전 포맷(본문 포함) 인덱스도 요약으로 변환해 사용
+            self._summaries = [
+                summarize_publication(p) if "content" in p else p for p in items
+            ]
+        return self._summaries
+
+    def get(self, pub_id: str) -> Optional[Dict]:
+        """개별 출판물 전체 로드 (필요할 때만 파일을 연다)"""
+        if pub_id not in self._publications:
+            pub_file = self.pub_dir / f"{pub_id}.json"
+            if not pub_file.exists():
+                return None
+            self._publications[pub_id] = loads_json(pub_file.read_bytes())
+        return self._publications[pub_id]
+
+    def body(self, pub_id: str) -> str:
+        """출판물 본문"""
+        publication = self.get(pub_id) or {}
+        return (publication.get("content") or {}).get("body", "")
+
+    def youtube_ids(self) -> set:
+        """출판물에 연결된 YouTube 영상 ID 집합"""
+        return {vid for p in self.summaries() for vid in p.get("media", {}).get("youtube", [])}
+
+
+class SourceCache:
+    """원본 파일 → 출판물 ID 캐시 (내용 해시로 변경 여부 판단)"""
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file or SOURCE_CACHE_FILE
+        self._entries = None
+        self._dirty = False
+
+    @property
+    def entries(self) -> Dict:
+        """캐시 로드 (최초 접근 시 1회)"""
+        if self._entries is None:
+            self._entries = read_json(self.cache_file, {}).get("sources", {})
+        return self._entries
+
+    def key(self, file_path: Path) -> str:
+        """캐시 키 (저장소 안의 파일은 상대 경로)"""
+        resolved = file_path.resolve()
+        try:
+            return resolved.relative_to(ROOT_DIR.resolve()).as_posix()
+        except ValueError:
+            return resolved.as_posix()
+
+    def get(self, file_path: Path) -> Optional[Dict]:
+        """캐시 항목 조회"""
+        return self.entries.get(self.key(file_path))
+
+    def record(self, file_path: Path, source_hash: str, pub_id: str) -> None:
+        """처리 결과 기록"""
+        self.entries[self.key(file_path)] = {
+            "hash": source_hash,
+            "publicationId": pub_id,
+            "updatedAt": datetime.utcnow().isoformat() + "Z",
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """변경이 있을 때만 저장"""
+        if not self._dirty:
+            return
+        write_json(self.cache_file, {"version": "1.0.0", "sources": self.entries}, compact=True)
+        self._dirty = False
+
+
+class VideoIndex:
+    """YouTube 영상 ID → 출판물 ID 역색인 (출판물 인덱스 갱신 때마다 함께 유지)"""
+
+    def __init__(self, pub_dir: Optional[Path] = None):
+        self.index_file = (pub_dir or PUB_DIR) / VIDEO_INDEX_NAME
+        self._videos = None
+        self._dirty = False
+
+    @property
+    def exists(self) -> bool:
+        """역색인 파일 존재 여부"""
+        return self.index_file.exists()
+
+    @property
+    def videos(self) -> Dict[str, List[str]]:
+        """역색인 로드 (최초 접근 시 1회)"""
+        if self._videos is None:
+            self._videos = read_json(self.index_file, {}).get("videos", {})
+        return self._videos
+
+    def __contains__(self, video_id: str) -> bool:
+        return video_id in self.videos
+
+    def publications(self, video_id: str) -> List[str]:
+        """영상에 연결된 출판물 ID 목록"""
+        return self.videos.get(video_id, [])
+
+    def add(self, pub_id: str, video_ids: List[str]) -> None:
+        """출판물의 영상 연결 추가"""
+        for video_id in video_ids:
+            pub_ids = self.videos.setdefault(video_id, [])
+            if pub_id not in pub_ids:
+                pub_ids.append(pub_id)
+                self._dirty = True
+
+    def remove(self, pub_id: str, video_ids: List[str]) -> None:
+        """출판물의 영상 연결 제거"""
+        for video_id in video_ids:
+            pub_ids = self.videos.get(video_id)
+            if pub_ids and pub_id in pub_ids:
+                pub_ids.remove(pub_id)
+                if not pub_ids:
+                    del self.videos[video_id]
+                self._dirty = True
+
+    def rebuild(self, summaries: List[Dict]) -> None:
+        """요약 레코드 전체로 다시 생성"""
+        self._videos = {}
+        for p in summaries:
+            self.add(p.get("id"), p.get("media", {}).get("youtube", []))
+        self._dirty = True
+
+    def save(self) -> None:
+        """변경이 있을 때만 저장"""
+        if not self._dirty:
+            return
+        write_json(self.index_file, {"version": "1.0.0", "videos": self.videos}, compact=True)
+        self._dirty = False
+
 
 class MediaPipeline:
     """미디어 파이프라인 처리기"""
 
     def __init__(self):
         self.ensure_directories()
+        self.sources = SourceCache()
 
     def ensure_directories(self):
         """필수 디렉토리 확인"""
@@ -65,85 +388,106 @@ class MediaPipeline:
 
     def parse_markdown(self, content: str) -> Dict:
         """마크다운 콘텐츠 파싱"""
-        lines = content.strip().split("\n")
+        return self.parse_markdown_stream(io.StringIO(content))
+
+    def parse_markdown_stream(self, fp: TextIO) -> Dict:
+        """마크다운 스트림 파싱
+
+        프런트매터는 닫는 --- 까지 줄 단위로 읽고 본문은 한 번에 읽는다.
+        "frontMatter"/"source"는 미디어 링크 스캔용 원문 (source는 제목 줄을
+        떼기 전 본문).
+        """
         metadata = {}
-        body_lines = []
-        in_frontmatter = False
-        frontmatter_done = False
-
-        for line in lines:
-            if line.strip() == "---":
-                if not frontmatter_done:
-                    in_frontmatter = not in_frontmatter
-                    if not in_frontmatter:
-                        frontmatter_done = True
-                    continue
-
-            if in_frontmatter:
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    metadata[key.strip()] = value.strip().strip('"').strip("'")
-            else:
-                body_lines.append(line)
+        front_matter = ""
+
+        # 앞쪽 빈 줄 건너뛰기
+        line = fp.readline()
+        while line and not line.strip():
+            line = fp.readline()
 
-        body = "\n".join(body_lines).strip()
+        if line.strip() == "---":
+            front_matter = read_front_matter(fp)
+            metadata = parse_front_matter(front_matter)
+            source = fp.read()
+        else:
+            source = line + fp.read()
 
         # 제목 추출 (첫 번째 # 헤딩)
-        title_match = re.search(r"^#\s+(.+)$", body, re.MULTILINE)
-        if title_match and "title" not in metadata:
-            metadata["title"] = title_match.group(1)
-            body = body.replace(title_match.group(0), "", 1).strip()
+        body = source
+        if "title" not in metadata:
+            title_match = TITLE_PATTERN.search(body)
+            if title_match:
+                metadata["title"] = title_match.group(1)
+                body = body[:title_match.start()] + body[title_match.end():]
 
         return {
             "metadata": metadata,
-            "body": body,
+            "body": body.strip(),
+            "frontMatter": front_matter,
+            "source": source,
         }
 
-    def extract_media_links(self, content: str) -> Dict:
-        """콘텐츠에서 미디어 링크 추출"""
-        youtube_videos = []
-        spotify_links = []
+    def extract_media_links(self, *texts: str) -> Dict:
+        """콘텐츠에서 미디어 링크 추출 (단일 패스, 여러 조각이면 이어진 문서로 봄)
+
+        역할(main/supplement, main/background)은 기존과 같이 패턴 우선순위
+        (YouTube: watch → youtu.be → embed, Spotify: URL → URI) 다음 문서 순서로
+        정한다. 한 번 스캔한 결과를 (우선순위, 위치)로 정렬해 같은 순서를 만든다.
+        """
+        youtube_found = []   # (우선순위, 위치, 영상 ID)
+        spotify_found = []   # (우선순위, 위치, ID, 종류)
         images = []
+        seen_images = set()
+
+        def scan(text: str, offset: int = 0) -> None:
+            for match in MEDIA_LINK_PATTERN.finditer(text):
+                kind = match.lastgroup
+                position = offset + match.start()
+
+                if kind == "image":
+                    img_url = match.group("img_url")
+                    if img_url not in seen_images:
+                        seen_images.add(img_url)
+                        images.append(img_url)
+                    # 이미지 대체 텍스트/URL 안의 YouTube·Spotify 링크도 수집
+                    scan(match.group(0)[1:], position + 1)
+
+                elif kind == "spotify":
+                    if match.group("sp_id"):
+                        spotify_found.append((0, position, match.group("sp_id"), match.group("sp_type")))
+                    else:
+                        spotify_found.append((1, position, match.group("sp_uri_id"), match.group("sp_uri_type")))
+
+                else:
+                    link = match.group("youtube")
+                    priority = 0 if "watch?v=" in link else 1 if "youtu.be/" in link else 2
+                    youtube_found.append((priority, position, match.group("yt_id")))
+
+        offset = 0
+        for text in texts:
+            scan(text, offset)
+            offset += len(text) + 1
 
-        # YouTube 링크
-        yt_patterns = [
-            r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([A-Za-z0-9_-]{11})",
-            r"(?:https?://)?(?:www\.)?youtu\.be/([A-Za-z0-9_-]{11})",
-            r"(?:https?://)?(?:www\.)?youtube\.com/embed/([A-Za-z0-9_-]{11})",
-        ]
-
-        for pattern in yt_patterns:
-            for match in re.finditer(pattern, content):
-                video_id = match.group(1)
-                if video_id not in [v["videoId"] for v in youtube_videos]:
-                    youtube_videos.append({
-                        "videoId": video_id,
-                        "role": "main" if not youtube_videos else "supplement",
-                    })
-
-        # Spotify 링크
-        sp_patterns = [
-            r"(?:https?://)?open\.spotify\.com/(track|album|playlist|artist)/([A-Za-z0-9]+)",
-            r"spotify:(track|album|playlist|artist):([A-Za-z0-9]+)",
-        ]
-
-        for pattern in sp_patterns:
-            for match in re.finditer(pattern, content):
-                sp_type = match.group(1)
-                sp_id = match.group(2)
-                if sp_id not in [s["spotifyId"] for s in spotify_links]:
-                    spotify_links.append({
-                        "spotifyId": sp_id,
-                        "type": sp_type,
-                        "role": "main" if not spotify_links else "background",
-                    })
-
-        # 이미지 링크
-        img_pattern = r"!\[.*?\]\((.+?)\)"
-        for match in re.finditer(img_pattern, content):
-            img_url = match.group(1)
-            if img_url not in images:
-                images.append(img_url)
+        youtube_videos = []
+        seen_videos = set()
+        for _, _, video_id in sorted(youtube_found):
+            if video_id not in seen_videos:
+                seen_videos.add(video_id)
+                youtube_videos.append({
+                    "videoId": video_id,
+                    "role": "main" if not youtube_videos else "supplement",
+                })
+
+        spotify_links = []
+        seen_spotify = set()
+        for _, _, sp_id, sp_type in sorted(spotify_found):
+            if sp_id not in seen_spotify:
+                seen_spotify.add(sp_id)
+                spotify_links.append({
+                    "spotifyId": sp_id,
+                    "type": sp_type,
+                    "role": "main" if not spotify_links else "background",
+                })
 
         return {
             "youtube": youtube_videos,
@@ -153,27 +497,32 @@ class MediaPipeline:
 
     def create_publication(
         self,
-        content: str,
+        content: Union[str, TextIO],
         persona: Optional[str] = None,
         pub_type: str = "article",
         status: str = "draft",
         series_id: Optional[str] = None,
         tags: Optional[List[str]] = None,
     ) -> Dict:
-        """출판물 생성"""
-        parsed = self.parse_markdown(content)
+        """출판물 생성 (문자열 또는 열린 파일)"""
+        if isinstance(content, str):
+            content = io.StringIO(content)
+        parsed = self.parse_markdown_stream(content)
         metadata = parsed["metadata"]
         body = parsed["body"]
 
-        # 미디어 링크 추출
-        media = self.extract_media_links(content)
+        # 미디어 링크 추출 (프런트매터 + 제목 줄 포함 본문)
+        media = self.extract_media_links(parsed["frontMatter"], parsed["source"])
 
         # 메타데이터에서 값 가져오기 (우선순위)
         title = metadata.get("title", "Untitled")
         subtitle = metadata.get("subtitle", "")
         persona = metadata.get("persona", persona)
         pub_type = metadata.get("type", pub_type)
-        tags = metadata.get("tags", "").split(",") if metadata.get("tags") else (tags or [])
+        meta_tags = metadata.get("tags")
+        if isinstance(meta_tags, str):
+            meta_tags = meta_tags.split(",")
+        tags = meta_tags or tags or []
         tags = [t.strip() for t in tags if t.strip()]
 
         # ID 생성
@@ -211,91 +560,341 @@ class MediaPipeline:
         """출판물 저장"""
         pub_file = PUB_DIR / f"{publication['id']}.json"
 
-        with open(pub_file, "w", encoding="utf-8") as f:
-            json.dump(publication, f, indent=2, ensure_ascii=False)
+        write_json(pub_file, publication)
 
         print(f"[OK] 출판물 저장: {pub_file.name}")
         return pub_file
 
-    def update_index(self) -> None:
-        """출판물 인덱스 업데이트"""
-        publications = []
+    def load_index_state(self) -> tuple:
+        """이전 인덱스와 파일 매니페스트 로드 (증분 갱신용)"""
+        if not INDEX_FILE.exists() or not INDEX_MANIFEST_FILE.exists():
+            return [], {}
+
+        try:
+            index_data = loads_json(INDEX_FILE.read_bytes())
+            files = loads_json(INDEX_MANIFEST_FILE.read_bytes()).get("files", {})
+        except json.JSONDecodeError as e:
+            print(f"[WARN] 인덱스 상태 손상, 전체 재생성: {e}")
+            return [], {}
+
+        # 이전 포맷(본문 포함) 인덱스는 재사용하지 않고 전체 재생성
+        if index_data.get("version") != INDEX_VERSION:
+            return [], {}
+
+        return index_data.get("items", []), files
+
+    def scan_publications(self, previous_files: Dict, indexed_ids: set, paths: Optional[List[Path]] = None) -> tuple:
+        """변경된 출판물 파일만 다시 읽기
+
+        (mtime, size)가 같으면 파일을 열지 않고, 달라도 내용 해시가 같으면
+        파싱을 건너뛴다. paths가 주어지면 그 파일만 확인하고 나머지는 매니페스트를
+        그대로 믿는다. 반환값: (변경 없는 ID 집합, 변경된 요약 레코드 목록, 새 매니페스트)
+        """
+        unchanged_ids = set()
+        changed = []
+        files = {}
+
+        if paths is not None:
+            names = {Path(p).name for p in paths}
+            for name, entry in previous_files.items():
+                if name not in names and entry.get("id") in indexed_ids:
+                    unchanged_ids.add(entry["id"])
+                    files[name] = entry
+            candidates = [PUB_DIR / name for name in sorted(names) if (PUB_DIR / name).exists()]
+        else:
+            candidates = PUB_DIR.glob("pub-*.json")
+
+        for f in candidates:
+            stat = f.stat()
+            entry = previous_files.get(f.name)
+
+            if (
+                entry
+                and entry.get("id") in indexed_ids
+                and entry.get("mtime") == stat.st_mtime_ns
+                and entry.get("size") == stat.st_size
+            ):
+                unchanged_ids.add(entry["id"])
+                files[f.name] = entry
+                continue
+
+            raw = f.read_bytes()
+            content_hash = hashlib.sha256(raw).hexdigest()
+
+            if entry and entry.get("id") in indexed_ids and entry.get("hash") == content_hash:
+                unchanged_ids.add(entry["id"])
+                files[f.name] = dict(entry, mtime=stat.st_mtime_ns, size=stat.st_size)
+                continue
 
-        for f in PUB_DIR.glob("pub-*.json"):
             try:
-                with open(f, "r", encoding="utf-8") as fp:
-                    pub = json.load(fp)
-                    publications.append(pub)
+                pub = loads_json(raw)
             except json.JSONDecodeError as e:
                 print(f"[WARN] JSON 파싱 실패: {f.name} - {e}")
                 continue
 
-        # 날짜순 정렬
-        publications.sort(key=lambda x: x.get("createdAt", ""), reverse=True)
+            changed.append(summarize_publication(pub))
+            files[f.name] = {
+                "id": pub.get("id"),
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": content_hash,
+            }
+
+        return unchanged_ids, changed, files
+
+    def update_index(self, full: bool = False, paths: Optional[List[Path]] = None) -> None:
+        """출판물 인덱스 업데이트
+
+        기본은 증분 모드: 매니페스트와 비교해 바뀐 파일만 파싱한 뒤
+        이미 정렬된 기존 인덱스에 병합한다. full=True면 전체 재생성.
+        paths를 주면 디렉토리를 훑지 않고 해당 파일만 다시 확인한다.
+        """
+        previous_items, previous_files = ([], {}) if full else self.load_index_state()
+        indexed_ids = {p.get("id") for p in previous_items}
+        if not previous_items:
+            paths = None
+
+        unchanged_ids, changed, files = self.scan_publications(previous_files, indexed_ids, paths)
+
+        # 날짜순 정렬 (기존 인덱스는 이미 정렬되어 있으므로 변경분만 정렬 후 병합)
+        sort_key = lambda x: x.get("createdAt", "")
+        kept = [p for p in previous_items if p.get("id") in unchanged_ids]
+        changed.sort(key=sort_key, reverse=True)
+        publications = list(heapq.merge(kept, changed, key=sort_key, reverse=True))
 
         # 인덱스 저장
         index_data = {
-            "$schema": "../config/schemas.json#/schemas/publication",
+            "$schema": "../config/schemas.json#/schemas/publicationSummary",
             "collection": "publications",
-            "version": "1.0.0",
+            "version": INDEX_VERSION,
             "count": len(publications),
             "lastUpdated": datetime.utcnow().isoformat() + "Z",
             "items": publications,
         }
 
-        index_file = PUB_DIR / "index.json"
-        with open(index_file, "w", encoding="utf-8") as f:
-            json.dump(index_data, f, indent=2, ensure_ascii=False)
+        write_json(INDEX_FILE, index_data, compact=True)
+
+        manifest_data = {
+            "version": "1.0.0",
+            "lastUpdated": index_data["lastUpdated"],
+            "files": files,
+        }
+
+        write_json(INDEX_MANIFEST_FILE, manifest_data, compact=True)
+
+        # 영상 → 출판물 역색인 (변경분만 반영, 없거나 전체 재생성이면 다시 만듦)
+        video_index = VideoIndex()
+        if not previous_items or not video_index.exists:
+            video_index.rebuild(publications)
+        else:
+            for p in previous_items:
+                if p.get("id") not in unchanged_ids:
+                    video_index.remove(p.get("id"), p.get("media", {}).get("youtube", []))
+            for p in changed:
+                video_index.add(p.get("id"), p.get("media", {}).get("youtube", []))
+        video_index.save()
 
         # API 엔드포인트 업데이트
         published = [p for p in publications if p.get("status") == "published"]
-        api_data = {
+        shard_count = self.write_api(published)
+
+        print(f"[OK] 인덱스 업데이트: {len(publications)}개 출판물 (재파싱 {len(changed)}개)")
+        print(f"[OK] API 샤드 {shard_count}개 생성")
+
+    def write_api(self, summaries: List[Dict]) -> int:
+        """정적 API 생성 (전체/페르소나/타입/태그별 페이지 샤드)
+
+        api/v1/publications.json은 기존 클라이언트를 위해 1페이지를 유지하고,
+        나머지는 api/v1/publications/ 아래 page-N.json 샤드로 나눈다.
+        내용이 같은 샤드는 다시 쓰지 않고, 더 이상 만들지 않는 샤드만 지운다.
+        """
+        generated_at = datetime.utcnow().isoformat() + "Z"
+        written = set()
+
+        facets = {"persona": {}, "type": {}, "tag": {}}
+        for summary in summaries:
+            if summary.get("persona"):
+                facets["persona"].setdefault(summary["persona"], []).append(summary)
+            if summary.get("type"):
+                facets["type"].setdefault(summary["type"], []).append(summary)
+            for tag in summary.get("tags", []):
+                facets["tag"].setdefault(tag, []).append(summary)
+
+        # 전체 목록
+        pages = self.write_api_pages(API_SHARD_DIR, summaries, generated_at, written)
+
+        # 하위 호환: 기존 단일 엔드포인트 = 1페이지
+        api_data = build_api_page(summaries, 1, pages, api_path(API_SHARD_DIR), generated_at)
+        write_api_file(API_DIR / "publications.json", api_data)
+
+        # 페르소나/타입/태그별 샤드
+        facet_index = {}
+        for facet, groups in facets.items():
+            facet_index[facet] = {}
+            slugs = shard_slugs(groups)
+            for value, items in sorted(groups.items()):
+                shard_dir = API_SHARD_DIR / facet / slugs[value]
+                total_pages = self.write_api_pages(shard_dir, items, generated_at, written)
+                facet_index[facet][value] = {
+                    "path": api_path(shard_dir),
+                    "total": len(items),
+                    "totalPages": total_pages,
+                }
+
+        index_file = API_SHARD_DIR / "index.json"
+        write_api_file(index_file, {
             "success": True,
             "data": {
-                "publications": published[:20],
-                "total": len(published),
-                "page": 1,
-                "perPage": 20,
+                "total": len(summaries),
+                "perPage": API_PER_PAGE,
+                "totalPages": pages,
+                "path": api_path(API_SHARD_DIR),
+                "facets": facet_index,
             },
             "meta": {
-                "generatedAt": datetime.utcnow().isoformat() + "Z",
+                "generatedAt": generated_at,
                 "source": "/data/publications/index.json",
             },
-        }
+        })
+        written.add(index_file)
+
+        # 더 이상 존재하지 않는 페이지/샤드 정리
+        for stale in API_SHARD_DIR.rglob("*.json"):
+            if stale not in written:
+                stale.unlink()
+        for shard_dir in sorted(API_SHARD_DIR.rglob("*"), reverse=True):
+            if shard_dir.is_dir() and not any(shard_dir.iterdir()):
+                shard_dir.rmdir()
+
+        return len(written)
+
+    def write_api_pages(self, shard_dir: Path, items: List[Dict], generated_at: str, written: set) -> int:
+        """하나의 목록을 page-N.json 파일들로 분할 저장"""
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        total_pages = max(1, -(-len(items) // API_PER_PAGE))
+        base = api_path(shard_dir)
+
+        for page in range(1, total_pages + 1):
+            page_file = shard_dir / f"page-{page}.json"
+            write_api_file(page_file, build_api_page(items, page, total_pages, base, generated_at))
+            written.add(page_file)
+
+        return total_pages
+
+    def publish_file(self, file_path: Path, existing_id: Optional[str] = None, **kwargs) -> Dict:
+        """파일을 출판물로 변환 후 저장 (existing_id가 있으면 기존 출판물을 갱신)"""
+        with open(file_path, "r", encoding="utf-8") as f:
+            publication = self.create_publication(f, **kwargs)
+
+        if existing_id:
+            existing_file = PUB_DIR / f"{existing_id}.json"
+            if existing_file.exists():
+                with open(existing_file, "r", encoding="utf-8") as f:
+                    existing = json.load(f)
+                publication["createdAt"] = existing.get("createdAt", publication["createdAt"])
+                if publication["publishedAt"] and existing.get("publishedAt"):
+                    publication["publishedAt"] = existing["publishedAt"]
+            publication["id"] = existing_id
+
+        self.save_publication(publication)
+        return publication
 
-        api_file = API_DIR / "publications.json"
-        with open(api_file, "w", encoding="utf-8") as f:
-            json.dump(api_data, f, indent=2, ensure_ascii=False)
+    def check_source(self, file_path: Path, force: bool = False, **kwargs) -> tuple:
+        """캐시 확인. 반환값: (건너뛸지 여부, 기존 출판물 ID, 내용 해시)"""
+        source_hash = hash_source(file_path, kwargs)
+        entry = self.sources.get(file_path)
+        existing_id = entry.get("publicationId") if entry else None
 
-        print(f"[OK] 인덱스 업데이트: {len(publications)}개 출판물")
+        if (
+            not force
+            and entry
+            and entry.get("hash") == source_hash
+            and (PUB_DIR / f"{existing_id}.json").exists()
+        ):
+            return True, existing_id, source_hash
 
-    def process_file(self, file_path: Path, **kwargs) -> Optional[Dict]:
-        """파일 처리"""
+        return False, existing_id, source_hash
+
+    def process_file(self, file_path: Path, force: bool = False, **kwargs) -> Optional[Dict]:
+        """파일 처리 (변경 없는 파일은 건너뜀)"""
         if not file_path.exists():
             print(f"[ERROR] 파일 없음: {file_path}")
             return None
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        skip, existing_id, source_hash = self.check_source(file_path, force, **kwargs)
+        if skip:
+            print(f"[SKIP] 변경 없음: {file_path.name} → {existing_id}")
+            return None
 
-        publication = self.create_publication(content, **kwargs)
-        self.save_publication(publication)
+        publication = self.publish_file(file_path, existing_id, **kwargs)
+        self.sources.record(file_path, source_hash, publication["id"])
+        self.sources.save()
         return publication
 
-    def process_batch(self, directory: Path, **kwargs) -> List[Dict]:
-        """디렉토리 내 모든 마크다운 파일 처리"""
-        publications = []
-
+    def process_batch(
+        self,
+        directory: Path,
+        full_index: bool = False,
+        jobs: int = 1,
+        force: bool = False,
+        **kwargs,
+    ) -> List[Dict]:
+        """디렉토리 내 모든 마크다운 파일 처리
+
+        jobs > 1이면 프로세스 풀에서 병렬 처리한다. 결과 순서는 파일명 순으로
+        고정되며, 캐시와 인덱스는 마지막에 한 번만 저장한다.
+        """
+        pending = []
+        skipped = 0
         for file_path in sorted(directory.glob("*.md")):
-            print(f"\n처리 중: {file_path.name}")
-            pub = self.process_file(file_path, **kwargs)
-            if pub:
-                publications.append(pub)
-
-        self.update_index()
+            skip, existing_id, source_hash = self.check_source(file_path, force, **kwargs)
+            if skip:
+                skipped += 1
+            else:
+                pending.append((file_path, existing_id, source_hash))
+
+        if skipped:
+            print(f"[SKIP] 변경 없는 파일 {skipped}개 건너뜀")
+
+        files = [file_path for file_path, _, _ in pending]
+        existing_ids = [existing_id for _, existing_id, _ in pending]
+        jobs = jobs or os.cpu_count() or 1
+
+        if jobs > 1 and len(files) > 1:
+            print(f"병렬 처리: {len(files)}개 파일, 워커 {jobs}개")
+            chunksize = max(1, len(files) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                publications = list(executor.map(
+                    _publish_file_job, files, existing_ids, repeat(kwargs), chunksize=chunksize
+                ))
+        else:
+            publications = []
+            for file_path, existing_id in zip(files, existing_ids):
+                print(f"\n처리 중: {file_path.name}")
+                publications.append(self.publish_file(file_path, existing_id, **kwargs))
+
+        for (file_path, _, source_hash), pub in zip(pending, publications):
+            self.sources.record(file_path, source_hash, pub["id"])
+        self.sources.save()
+
+        self.update_index(full=full_index)
         return publications
 
 
+def _publish_file_job(file_path: Path, existing_id: Optional[str], kwargs: Dict) -> Dict:
+    """프로세스 풀 워커: 파일 하나를 출판물로 변환 후 저장"""
+    return MediaPipeline().publish_file(file_path, existing_id, **kwargs)
+
+
+def hash_source(file_path: Path, options: Dict) -> str:
+    """원본 파일 내용 + 처리 옵션 해시 (파일은 청크 단위로 읽음)"""
+    digest = hashlib.sha256(json.dumps(options, sort_keys=True, ensure_ascii=False).encode())
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def main():
     parser = argparse.ArgumentParser(description="PARKSY Media Pipeline")
     parser.add_argument("--input", "-i", type=Path, help="입력 마크다운 파일")
@@ -305,6 +904,9 @@ def main():
     parser.add_argument("--status", "-s", choices=["draft", "published"], default="draft", help="상태")
     parser.add_argument("--series", help="시리즈 ID")
     parser.add_argument("--tags", help="태그 (쉼표로 구분)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="배치 병렬 워커 수 (0이면 CPU 수)")
+    parser.add_argument("--force", action="store_true", help="변경 없는 파일도 다시 처리")
+    parser.add_argument("--full-index", action="store_true", help="인덱스 증분 갱신 대신 전체 재생성")
 
     args = parser.parse_args()
 
@@ -329,13 +931,15 @@ def main():
 
     if args.batch:
         print(f"배치 모드: {args.batch}")
-        publications = pipeline.process_batch(args.batch, **kwargs)
+        publications = pipeline.process_batch(
+            args.batch, full_index=args.full_index, jobs=args.jobs, force=args.force, **kwargs
+        )
         print(f"\n총 {len(publications)}개 출판물 처리 완료")
     else:
         print(f"단일 파일: {args.input}")
-        publication = pipeline.process_file(args.input, **kwargs)
+        publication = pipeline.process_file(args.input, force=args.force, **kwargs)
         if publication:
-            pipeline.update_index()
+            pipeline.update_index(full=args.full_index, paths=[PUB_DIR / f"{publication['id']}.json"])
             print(f"\n출판물 ID: {publication['id']}")
 
     print("=" * 60)
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+PARKSY Publisher Platform - Storage
+모든 파이프라인이 공유하는 JSON/텍스트 파일 저장 계층
+
+쓰기는 항상 같은 디렉토리의 임시 파일 → fsync → rename 순서로 진행되므로,
+도중에 프로세스가 죽거나 두 실행이 겹쳐도 대상 파일은 이전 내용 또는
+새 내용 중 하나로만 보인다 (잘린 index.json이 남지 않음).
+
+JSON 직렬화는 orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로
+대체한다. PARKSY_JSON_BACKEND=json 으로 표준 라이브러리를 강제할 수 있다.
+
+읽고-고쳐-쓰는 상태 파일은 file_lock()으로 프로세스 간 배타 잠금을 건다.
+
+사용법:
+    from storage import read_json, write_json
+
+    write_json(path, data)                 # 사람이 읽는 파일 (indent=2)
+    write_json(path, data, compact=True)   # 기계 전용 대용량 인덱스
+    write_json_many([(path, data), ...])   # 여러 파일 (디렉토리 fsync는 한 번씩)
+
+    with file_lock(path.with_suffix(".lock")):
+        state = read_json(path, {})
+        ...
+        write_json(path, state)
+"""
+
+import os
+import json
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _stdlib_dumps(data: Any, compact: bool) -> bytes:
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _stdlib_loads(raw: bytes) -> Any:
+    return json.loads(raw.decode("utf-8"))
+
+
+# 백엔드 이름 → (dumps(data, compact) -> bytes, loads(bytes) -> data)
+BACKENDS: Dict[str, Tuple[Callable, Callable]] = {
+    "json": (_stdlib_dumps, _stdlib_loads),
+}
+
+try:
+    import orjson
+
+    def _orjson_dumps(data: Any, compact: bool) -> bytes:
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
+
+    BACKENDS["orjson"] = (_orjson_dumps, orjson.loads)
+except ImportError:
+    pass
+
+
+def select_backend(name: str = "") -> str:
+    """사용할 JSON 백엔드 선택 (지정값 → orjson → json)"""
+    name = name or os.environ.get("PARKSY_JSON_BACKEND", "")
+    if name in BACKENDS:
+        return name
+    return "orjson" if "orjson" in BACKENDS else "json"
+
+
+JSON_BACKEND = select_backend()
+
+# 현재 umask (조회하려면 바꿨다가 되돌려야 하므로 시작 시 한 번)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_dumps, _loads = BACKENDS[JSON_BACKEND]
+
+
+def dumps_json(data: Any, compact: bool = False) -> bytes:
+    """JSON 직렬화 (UTF-8 바이트, compact면 공백 없는 한 줄)"""
+    return _dumps(data, compact)
+
+
+def loads_json(raw: bytes) -> Any:
+    """JSON 역직렬화 (손상 시 json.JSONDecodeError 계열 예외)"""
+    return _loads(raw)
+
+
+def write_text(path: Path, text: str) -> Path:
+    """텍스트 파일 원자적 저장"""
+    return write_bytes(path, text.encode("utf-8"))
+
+
+def write_bytes(path: Path, raw: bytes) -> Path:
+    """파일 원자적 저장 (임시 파일 + fsync + rename)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _replace_file(path, raw)
+    _fsync_dir(path.parent)
+    return path
+
+
+def _file_mode(path: Path) -> int:
+    """저장할 파일 권한 (기존 파일이 있으면 그 권한, 없으면 0o666 & ~umask)"""
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def _replace_file(path: Path, raw: bytes) -> None:
+    """임시 파일에 쓰고 fsync 후 대상 파일로 교체 (디렉토리 fsync 제외)"""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        if hasattr(os, "fchmod"):
+            # mkstemp는 0600으로 만들므로 일반 쓰기와 같은 권한으로 맞춤
+            os.fchmod(fd, _file_mode(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_json(path: Path, data: Any, compact: bool = False) -> Path:
+    """JSON 파일 원자적 저장"""
+    return write_bytes(path, dumps_json(data, compact))
+
+
+def write_json_many(items: Iterable[Tuple[Path, Any]], compact: bool = False) -> int:
+    """여러 JSON 파일 원자적 저장 (파일마다 fsync, 디렉토리 fsync는 끝에 한 번씩), 저장한 수 반환"""
+    directories = set()
+    count = 0
+    for path, data in items:
+        path = Path(path)
+        if path.parent not in directories:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            directories.add(path.parent)
+        _replace_file(path, dumps_json(data, compact))
+        count += 1
+    for directory in directories:
+        _fsync_dir(directory)
+    return count
+
+
+def read_json(path: Path, default: Any = None) -> Any:
+    """JSON 파일 로드 (없거나 손상되면 default, 손상은 경고 출력)"""
+    path = Path(path)
+    if not path.exists():
+        return default
+
+    try:
+        return loads_json(path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        print(f"[WARN] JSON 파싱 실패: {path} - {e}")
+        return default
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """잠금 파일로 프로세스 간 배타 잠금 (POSIX flock, Windows msvcrt.locking)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK은 약 10초 후 포기하므로 계속 재시도
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """rename 결과를 디스크에 반영 (POSIX 전용, 그 외는 무시)"""
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
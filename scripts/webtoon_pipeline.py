@@ -20,6 +20,8 @@ from typing import Optional, Dict, List
 import hashlib
 import re
 
+from storage import write_json, write_text
+
 # === 설정 ===
 
 DATA_DIR = Path(__file__).parent.parent / "data"
@@ -160,8 +162,7 @@ class WebtoonPipeline:
         webtoon_path = WEBTOON_DIR / webtoon["id"]
         meta_file = webtoon_path / "metadata.json"
 
-        with open(meta_file, "w", encoding="utf-8") as f:
-            json.dump(webtoon, f, indent=2, ensure_ascii=False)
+        write_json(meta_file, webtoon)
 
         return meta_file
 
@@ -353,18 +354,20 @@ class WebtoonPipeline:
 
         output_file = WEBTOON_DIR / webtoon_id / "episodes" / f"ep{episode_number:03d}" / "prompts.txt"
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(f"# {webtoon['title']} - Episode {episode_number}: {episode['title']}\n")
-            f.write(f"# Generated: {datetime.utcnow().isoformat()}\n\n")
-
-            for panel in episode["panels"]:
-                f.write(f"## Panel {panel['order']}\n")
-                f.write(f"Description: {panel.get('description', '')}\n")
-                f.write(f"Characters: {panel.get('characters', '')}\n")
-                f.write(f"Dialogue: {', '.join(panel.get('dialogue', []))}\n\n")
-                f.write("### AI Prompt:\n")
-                f.write(f"{panel.get('aiPrompt', 'No prompt generated')}\n")
-                f.write("\n" + "="*60 + "\n\n")
+        lines = [
+            f"# {webtoon['title']} - Episode {episode_number}: {episode['title']}\n",
+            f"# Generated: {datetime.utcnow().isoformat()}\n\n",
+        ]
+        for panel in episode["panels"]:
+            lines.append(f"## Panel {panel['order']}\n")
+            lines.append(f"Description: {panel.get('description', '')}\n")
+            lines.append(f"Characters: {panel.get('characters', '')}\n")
+            lines.append(f"Dialogue: {', '.join(panel.get('dialogue', []))}\n\n")
+            lines.append("### AI Prompt:\n")
+            lines.append(f"{panel.get('aiPrompt', 'No prompt generated')}\n")
+            lines.append("\n" + "="*60 + "\n\n")
+
+        write_text(output_file, "".join(lines))
 
         return output_file
 
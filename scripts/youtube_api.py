@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+PARKSY Publisher Platform - YouTube Data API Client
+youtube_sync.py에서 사용하는 재사용 가능한 API 클라이언트
+
+- 스레드별 keep-alive 연결 재사용 (요청마다 새 연결을 열지 않음)
+- get_many(): 여러 요청을 제한된 동시성으로 병렬 실행, 결과는 입력 순서 유지
+- gzip 응답 지원
+- 429/5xx 및 연결 오류 시 지수 백오프 재시도 (Retry-After 존중)
+- ResponseCache: ETag 저장 후 If-None-Match 재전송, 304면 저장된 응답 재사용
+
+base_url을 바꾸면 로컬 스텁 HTTP 서버를 상대로 테스트할 수 있다.
+"""
+
+import gzip
+import json
+import time
+import random
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import urlencode, urlsplit
+
+from storage import read_json, write_json
+
+YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
+USER_AGENT = "PARKSY-Publisher/2.0"
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class YouTubeAPIError(Exception):
+    """API 요청 실패 (재시도 후에도 실패한 경우 포함)"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class ResponseCache:
+    """조건부 요청용 응답 캐시 (URL(API 키 제외) → ETag + 파싱된 응답)"""
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self.entries = read_json(cache_file, {}).get("entries", {})
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(endpoint: str, params: Dict) -> str:
+        """캐시 키 (API 키는 포함하지 않음)"""
+        return f"{endpoint}?" + urlencode(sorted(params.items()))
+
+    def get(self, key: str) -> Optional[Dict]:
+        """저장된 항목 ({"etag", "data"})"""
+        return self.entries.get(key)
+
+    def put(self, key: str, etag: str, data: Dict) -> None:
+        """ETag와 응답 저장"""
+        with self._lock:
+            self.entries[key] = {"etag": etag, "data": data}
+            self._dirty = True
+
+    def record(self, hit: bool) -> None:
+        """적중/미스 집계"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def save(self) -> None:
+        """변경이 있을 때만 저장"""
+        if self._dirty:
+            write_json(self.cache_file, {"version": "1.0.0", "entries": self.entries}, compact=True)
+            self._dirty = False
+
+
+class YouTubeClient:
+    """YouTube Data API v3 클라이언트"""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = YOUTUBE_API_BASE,
+        max_workers: int = 4,
+        timeout: float = 30,
+        retries: int = 3,
+        backoff: float = 1.0,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.api_key = api_key
+        self.cache = cache
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+
+        parts = urlsplit(base_url)
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._prefix = parts.path.rstrip("/")
+
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._executor = None
+        self.stats = {"requests": 0, "retries": 0, "errors": 0}
+
+    # === 연결 관리 ===
+
+    def _connection(self) -> http.client.HTTPConnection:
+        """현재 스레드의 keep-alive 연결 (없으면 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(self._netloc, timeout=self.timeout)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _reset_connection(self) -> None:
+        """끊긴 연결 폐기 (다음 요청에서 재연결)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            with self._lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+
+    def close(self) -> None:
+        """워커 스레드와 모든 연결 닫기"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # === 요청 ===
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _sleep_before_retry(self, attempt: int, retry_after: Optional[str] = None) -> None:
+        """지수 백오프 + 지터 (Retry-After 헤더가 있으면 우선)"""
+        self._count("retries")
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = self.backoff * (2 ** attempt) * (0.5 + random.random() / 2)
+        time.sleep(delay)
+
+    def request(self, endpoint: str, params: Dict, headers: Optional[Dict] = None) -> tuple:
+        """GET 요청. 반환값: (status, 응답 객체, 본문 bytes)"""
+        path = f"{self._prefix}/{endpoint}?" + urlencode(dict(params, key=self.api_key))
+        request_headers = {
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
+        }
+        request_headers.update(headers or {})
+
+        for attempt in range(self.retries + 1):
+            self._count("requests")
+            reused = getattr(self._local, "conn", None) is not None
+            try:
+                conn = self._connection()
+                conn.request("GET", path, headers=request_headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                self._reset_connection()
+                if attempt < self.retries:
+                    # 서버가 닫은 keep-alive 연결이면 대기 없이 바로 재연결
+                    if not reused:
+                        self._sleep_before_retry(attempt)
+                    continue
+                self._count("errors")
+                raise YouTubeAPIError(f"{endpoint}: 연결 실패 - {e}") from e
+
+            if response.status in RETRY_STATUS and attempt < self.retries:
+                self._sleep_before_retry(attempt, response.getheader("Retry-After"))
+                continue
+
+            if response.getheader("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+
+            if response.status == 304:
+                return response.status, response, body
+
+            if response.status >= 400:
+                self._count("errors")
+                raise YouTubeAPIError(f"{endpoint}: HTTP {response.status}", response.status)
+
+            return response.status, response, body
+
+        raise YouTubeAPIError(f"{endpoint}: 재시도 횟수 초과")
+
+    def get(self, endpoint: str, params: Dict, cache: bool = False) -> Dict:
+        """GET 요청 후 JSON 파싱"""
+        data, _ = self.fetch(endpoint, params, cache)
+        return data
+
+    def fetch(self, endpoint: str, params: Dict, cache: bool = False) -> tuple:
+        """GET 요청. 반환값: (응답 데이터, 변경 여부)
+
+        cache=True면 저장된 ETag로 조건부 요청을 보내고, 304 응답이면 파싱 없이
+        저장된 데이터를 돌려준다 (변경 여부 False).
+        """
+        if not cache or self.cache is None:
+            _, _, body = self.request(endpoint, params)
+            return json.loads(body.decode("utf-8")), True
+
+        key = ResponseCache.key(endpoint, params)
+        entry = self.cache.get(key)
+        headers = {"If-None-Match": entry["etag"]} if entry else None
+
+        status, response, body = self.request(endpoint, params, headers)
+        if status == 304 and entry:
+            self.cache.record(hit=True)
+            return entry["data"], False
+
+        self.cache.record(hit=False)
+        data = json.loads(body.decode("utf-8"))
+        etag = response.getheader("ETag")
+        if etag:
+            self.cache.put(key, etag, data)
+        return data, True
+
+    def get_many(self, endpoint: str, params_list: List[Dict]) -> List[Union[Dict, YouTubeAPIError]]:
+        """여러 GET 요청을 최대 max_workers개씩 병렬 실행 (실패한 요청은 예외 객체로 반환)
+
+        워커 스레드는 클라이언트 수명 동안 유지되므로 각 스레드의 연결도 재사용된다.
+        """
+        def run(params: Dict) -> Union[Dict, YouTubeAPIError]:
+            try:
+                return self.get(endpoint, params)
+            except YouTubeAPIError as e:
+                return e
+
+        if len(params_list) <= 1 or self.max_workers <= 1:
+            return [run(params) for params in params_list]
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="youtube-api")
+        return list(self._executor.map(run, params_list))
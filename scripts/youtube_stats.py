@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+PARKSY Publisher Platform - YouTube Statistics Store
+동기화 때마다 수집한 영상 조회수/좋아요 수를 쌓아 두는 시계열 저장소
+
+data/youtube/stats/
+    videos.txt      영상 ID 사전 (한 줄에 하나, 줄 번호 = 행 번호, 추가만 함)
+    snapshots.bin   스냅샷 로그 (추가만 함)
+
+스냅샷 하나는 헤더(매직, 수집 시각, 행 수) 뒤에 행 번호 · 조회수 · 좋아요 수
+세 열을 각각 연속된 배열로 저장한다. 기존 데이터는 다시 쓰지 않으며, 쓰다가
+중단되어 잘린 마지막 스냅샷은 읽을 때 무시되고 다음 추가 때 잘라낸다.
+
+사용법:
+    python scripts/youtube_stats.py --top 10 --days 7
+    python scripts/youtube_stats.py --video VIDEO_ID
+"""
+
+import os
+import sys
+import time
+import struct
+import heapq
+import argparse
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+STATS_DIR = Path(__file__).parent.parent / "data" / "youtube" / "stats"
+
+SNAPSHOT_MAGIC = b"YTS1"
+SNAPSHOT_HEADER = struct.Struct("<4sdI")  # 매직, 수집 시각(epoch 초), 행 수
+ROW_TYPE = "I"    # 영상 행 번호 (uint32)
+COUNT_TYPE = "Q"  # 조회수/좋아요 수 (uint64)
+METRICS = ("views", "likes")
+
+
+def _to_bytes(values: array) -> bytes:
+    """리틀 엔디언 바이트로 변환"""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, raw: bytes) -> array:
+    """리틀 엔디언 바이트에서 배열 복원"""
+    values = array(typecode)
+    values.frombytes(raw)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _count(value) -> int:
+    """API 통계 값(문자열/None) → 정수"""
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class StatsStore:
+    """열 단위 추가 전용 영상 통계 저장소"""
+
+    def __init__(self, stats_dir: Optional[Path] = None):
+        self.stats_dir = stats_dir or STATS_DIR
+        self.ids_file = self.stats_dir / "videos.txt"
+        self.snapshots_file = self.stats_dir / "snapshots.bin"
+        self._video_ids = None
+        self._rows = None
+        self._snapshots = None
+        self._valid_end = 0
+
+    # === 영상 ID 사전 ===
+
+    @property
+    def video_ids(self) -> List[str]:
+        """행 번호 → 영상 ID"""
+        self._load_ids()
+        return self._video_ids
+
+    def _load_ids(self) -> None:
+        """영상 ID 사전 로드 (최초 1회)"""
+        if self._video_ids is None:
+            self._video_ids = []
+            if self.ids_file.exists():
+                text = self.ids_file.read_text(encoding="utf-8")
+                # 줄바꿈 없이 끝난 마지막 줄은 쓰다 만 것이므로 버림
+                self._video_ids = text.split("\n")[:-1]
+            self._rows = {vid: row for row, vid in enumerate(self._video_ids)}
+
+    def row(self, video_id: str) -> Optional[int]:
+        """영상의 행 번호"""
+        self._load_ids()
+        return self._rows.get(video_id)
+
+    def _assign_rows(self, video_ids: List[str]) -> List[int]:
+        """영상 ID에 행 번호 부여 (새 ID는 사전 끝에 추가)"""
+        self._load_ids()
+        new_ids = [vid for vid in dict.fromkeys(video_ids) if vid not in self._rows]
+        if new_ids:
+            self.stats_dir.mkdir(parents=True, exist_ok=True)
+            valid_size = sum(len(vid.encode("utf-8")) + 1 for vid in self._video_ids)
+            with open(self.ids_file, "ab") as f:
+                f.truncate(valid_size)
+                f.write("".join(vid + "\n" for vid in new_ids).encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+            for vid in new_ids:
+                self._rows[vid] = len(self._video_ids)
+                self._video_ids.append(vid)
+        return [self._rows[vid] for vid in video_ids]
+
+    # === 스냅샷 ===
+
+    def snapshots(self) -> List[Tuple[float, int, int]]:
+        """스냅샷 목록 [(수집 시각, 헤더 오프셋, 행 수)] (오래된 순)"""
+        if self._snapshots is None:
+            self._snapshots = []
+            self._valid_end = 0
+            if self.snapshots_file.exists():
+                size = self.snapshots_file.stat().st_size
+                with open(self.snapshots_file, "rb") as f:
+                    offset = 0
+                    while offset + SNAPSHOT_HEADER.size <= size:
+                        f.seek(offset)
+                        magic, timestamp, count = SNAPSHOT_HEADER.unpack(f.read(SNAPSHOT_HEADER.size))
+                        end = offset + SNAPSHOT_HEADER.size + count * self._row_bytes()
+                        if magic != SNAPSHOT_MAGIC or end > size:
+                            print(f"[WARN] 통계 스냅샷 손상 또는 미완료, {offset}바이트 이후 무시")
+                            break
+                        self._snapshots.append((timestamp, offset, count))
+                        offset = end
+                    self._valid_end = offset
+        return self._snapshots
+
+    @staticmethod
+    def _row_bytes() -> int:
+        """영상 한 행이 차지하는 바이트 수 (행 번호 + 지표들)"""
+        return array(ROW_TYPE).itemsize + array(COUNT_TYPE).itemsize * len(METRICS)
+
+    def append(self, stats: Dict[str, Dict], timestamp: Optional[float] = None) -> int:
+        """스냅샷 추가 (영상 ID → {"viewCount", "likeCount"}), 기록한 행 수 반환"""
+        if not stats:
+            return 0
+
+        video_ids = list(stats)
+        rows = array(ROW_TYPE, self._assign_rows(video_ids))
+        views = array(COUNT_TYPE, (_count(stats[vid].get("viewCount")) for vid in video_ids))
+        likes = array(COUNT_TYPE, (_count(stats[vid].get("likeCount")) for vid in video_ids))
+        timestamp = time.time() if timestamp is None else timestamp
+
+        self.snapshots()
+        with open(self.snapshots_file, "ab") as f:
+            # 이전에 쓰다 만 스냅샷이 있으면 잘라내고 이어 씀
+            f.truncate(self._valid_end)
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, timestamp, len(rows)))
+            f.write(_to_bytes(rows))
+            f.write(_to_bytes(views))
+            f.write(_to_bytes(likes))
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._snapshots.append((timestamp, self._valid_end, len(rows)))
+        self._valid_end += SNAPSHOT_HEADER.size + len(rows) * self._row_bytes()
+        return len(rows)
+
+    def read_snapshot(self, snapshot: Tuple[float, int, int]) -> Dict[int, Tuple[int, int]]:
+        """스냅샷 로드 (행 번호 → (조회수, 좋아요 수))"""
+        _, offset, count = snapshot
+        row_size = array(ROW_TYPE).itemsize * count
+        count_size = array(COUNT_TYPE).itemsize * count
+
+        with open(self.snapshots_file, "rb") as f:
+            f.seek(offset + SNAPSHOT_HEADER.size)
+            rows = _from_bytes(ROW_TYPE, f.read(row_size))
+            views = _from_bytes(COUNT_TYPE, f.read(count_size))
+            likes = _from_bytes(COUNT_TYPE, f.read(count_size))
+
+        return dict(zip(rows, zip(views, likes)))
+
+    def snapshot_before(self, timestamp: float) -> Optional[Tuple[float, int, int]]:
+        """주어진 시각 이전(포함)의 마지막 스냅샷 (없으면 가장 오래된 것)"""
+        snapshots = self.snapshots()
+        if not snapshots:
+            return None
+        earlier = [s for s in snapshots if s[0] <= timestamp]
+        return earlier[-1] if earlier else snapshots[0]
+
+    # === 조회 ===
+
+    def history(self, video_id: str) -> List[Dict]:
+        """영상의 통계 이력 (오래된 순)"""
+        row = self.row(video_id)
+        if row is None:
+            return []
+
+        history = []
+        for snapshot in self.snapshots():
+            values = self.read_snapshot(snapshot).get(row)
+            if values is not None:
+                history.append({"timestamp": snapshot[0], "views": values[0], "likes": values[1]})
+        return history
+
+    def growth(self, video_id: str, days: float = 7) -> Optional[Dict]:
+        """기간 동안의 증가량과 일평균 증가율"""
+        history = self.history(video_id)
+        if not history:
+            return None
+
+        latest = history[-1]
+        since = latest["timestamp"] - days * 86400
+        base = next((h for h in reversed(history) if h["timestamp"] <= since), history[0])
+        elapsed_days = max((latest["timestamp"] - base["timestamp"]) / 86400, 1 / 24)
+
+        result = {"videoId": video_id, "from": base["timestamp"], "to": latest["timestamp"]}
+        for metric in METRICS:
+            delta = latest[metric] - base[metric]
+            result[metric] = latest[metric]
+            result[f"{metric}Delta"] = delta
+            result[f"{metric}PerDay"] = delta / elapsed_days
+        return result
+
+    def top_movers(self, days: float = 7, limit: int = 10, metric: str = "views") -> List[Dict]:
+        """기간 동안 증가량이 가장 큰 영상 (최신 스냅샷 vs 기간 시작 시점 스냅샷)"""
+        snapshots = self.snapshots()
+        if not snapshots:
+            return []
+
+        column = METRICS.index(metric)
+        latest = snapshots[-1]
+        base = self.snapshot_before(latest[0] - days * 86400)
+        current = self.read_snapshot(latest)
+        previous = self.read_snapshot(base) if base is not latest else {}
+
+        deltas = (
+            (values[column] - previous[row][column], row)
+            for row, values in current.items()
+            if row in previous
+        )
+        elapsed_days = max((latest[0] - base[0]) / 86400, 1 / 24)
+        return [
+            {
+                "videoId": self.video_ids[row],
+                metric: current[row][column],
+                f"{metric}Delta": delta,
+                f"{metric}PerDay": delta / elapsed_days,
+            }
+            for delta, row in heapq.nlargest(limit, deltas)
+        ]
+
+
+def format_time(timestamp: float) -> str:
+    """epoch 초 → UTC ISO 문자열"""
+    return datetime.utcfromtimestamp(timestamp).isoformat(timespec="minutes") + "Z"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PARKSY YouTube Statistics")
+    parser.add_argument("--top", type=int, default=10, help="증가량 상위 영상 수")
+    parser.add_argument("--days", type=float, default=7, help="비교 기간 (일)")
+    parser.add_argument("--metric", choices=METRICS, default="views", help="정렬 기준")
+    parser.add_argument("--video", help="특정 영상의 이력 출력")
+    args = parser.parse_args()
+
+    store = StatsStore()
+    snapshots = store.snapshots()
+    if not snapshots:
+        print("[INFO] 수집된 통계가 없습니다.")
+        return
+
+    print(f"스냅샷 {len(snapshots)}개: {format_time(snapshots[0][0])} ~ {format_time(snapshots[-1][0])}")
+    print(f"영상 {len(store.video_ids)}개")
+    print()
+
+    if args.video:
+        for h in store.history(args.video):
+            print(f"  {format_time(h['timestamp'])}  조회수 {h['views']:>10,}  좋아요 {h['likes']:>8,}")
+        growth = store.growth(args.video, args.days)
+        if growth:
+            print(f"  최근 {args.days:g}일: 조회수 +{growth['viewsDelta']:,} ({growth['viewsPerDay']:,.1f}/일)")
+        return
+
+    print(f"최근 {args.days:g}일 {args.metric} 증가 상위 {args.top}개:")
+    for i, mover in enumerate(store.top_movers(args.days, args.top, args.metric), 1):
+        print(
+            f"  {i:2}. {mover['videoId']}  +{mover[f'{args.metric}Delta']:,}"
+            f" ({mover[f'{args.metric}PerDay']:,.1f}/일, 현재 {mover[args.metric]:,})"
+        )
+
+
+if __name__ == "__main__":
+    main()
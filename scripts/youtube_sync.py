@@ -5,181 +5,400 @@ YouTube 채널 자동 동기화 및 출판물 생성
 
 사용법:
     python scripts/youtube_sync.py --channel-id UC... [--api-key YOUR_KEY]
+    python scripts/youtube_sync.py --channel-id UC... --full   # 채널 전체 백필
+    python scripts/youtube_sync.py                             # platform.json의 모든 채널
+    python scripts/youtube_sync.py --stats-days 0              # 모든 영상 통계 갱신
 
 환경 변수:
     YOUTUBE_API_KEY: YouTube Data API v3 키
-    YOUTUBE_CHANNEL_ID: 채널 ID (옵션)
+    YOUTUBE_CHANNEL_ID: 채널 ID (옵션, platform.json에 채널 목록이 없을 때만 사용)
+    YOUTUBE_API_BASE: API 기본 URL (옵션, 로컬 스텁 서버 테스트용)
 """
 
 import os
 import sys
-import json
 import argparse
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
+from typing import Optional
+
+from media_pipeline import MediaPipeline, PublicationStore, VideoIndex
+from storage import read_json, write_json
+from youtube_api import YOUTUBE_API_BASE, ResponseCache, YouTubeAPIError, YouTubeClient
+from youtube_stats import StatsStore
 
 # === 설정 ===
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 YOUTUBE_DIR = DATA_DIR / "youtube"
 API_DIR = Path(__file__).parent.parent / "api" / "v1"
+INDEX_FILE = YOUTUBE_DIR / "index.json"
+INDEX_VERSION = "2.0.0"  # 2.x: 채널별 샤드 (channels/<채널ID>.json)
+CHANNELS_DIR = YOUTUBE_DIR / "channels"
+HTTP_CACHE_FILE = YOUTUBE_DIR / "http-cache.json"
+PLATFORM_CONFIG = DATA_DIR / "config" / "platform.json"
+STATS_DIR = YOUTUBE_DIR / "stats"
+STATS_RECENT_DAYS = 30  # 통계를 매 동기화마다 다시 받는 기존 영상 범위 (게시 후 일수)
+
+
+def load_channel_config(default_channel: Optional[str] = None) -> list:
+    """platform.json의 integrations.youtube.channels 채널 ID 목록
+
+    항목은 채널 ID 문자열 또는 {"id": "UC...", "persona": "...", "enabled": true} 형태.
+    목록이 비어 있으면 default_channel, 그것도 없으면 기존 단일 channelId.
+    """
+    youtube = read_json(PLATFORM_CONFIG, {}).get("integrations", {}).get("youtube", {})
+    channel_ids = []
+    for channel in youtube.get("channels", []):
+        if isinstance(channel, str):
+            channel_ids.append(channel)
+        elif channel.get("id") and channel.get("enabled", True):
+            channel_ids.append(channel["id"])
+    if not channel_ids and (default_channel or youtube.get("channelId")):
+        channel_ids.append(default_channel or youtube["channelId"])
+    return channel_ids
+
+
+def channel_shard_file(channel_id: str) -> Path:
+    """채널별 인덱스 샤드 경로"""
+    return CHANNELS_DIR / f"{channel_id}.json"
+
+
+def load_channel_videos(channel_id: str) -> list:
+    """채널 샤드의 영상 목록 (샤드가 없으면 v1 단일 인덱스에서 가져옴)"""
+    shard = read_json(channel_shard_file(channel_id))
+    if shard is not None:
+        return shard.get("items", [])
+
+    legacy = read_json(INDEX_FILE, {})
+    return [v for v in legacy.get("items", []) if v.get("channelId") == channel_id]
+
+
+def load_sync_watermark(channel_id: str) -> tuple:
+    """인덱스에 이미 있는 채널 영상 ID 집합과 최신 publishedAt (증분 동기화 기준점)"""
+    known_ids = set()
+    watermark = ""
+    for v in load_channel_videos(channel_id):
+        known_ids.add(v["videoId"])
+        watermark = max(watermark, v.get("publishedAt") or "")
+    return known_ids, watermark
+
+
+def load_sync_resume(channel_id: str) -> list:
+    """최대 개수 제한으로 다 가져오지 못한 구간 목록 [{"pageToken", "before"}] (최신 구간 먼저)"""
+    index = read_json(INDEX_FILE, {})
+    if index.get("version") != INDEX_VERSION:
+        return []
+    return index.get("channels", {}).get(channel_id, {}).get("resume", [])
+
 
-YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
+def parse_playlist_item(item: dict, channel_id: str) -> dict:
+    """playlistItems 항목 → 영상 레코드"""
+    snippet = item.get("snippet", {})
+    return {
+        "videoId": snippet.get("resourceId", {}).get("videoId"),
+        "title": snippet.get("title"),
+        "description": snippet.get("description", "")[:500],  # 처음 500자만
+        "channelId": channel_id,
+        "channelTitle": snippet.get("channelTitle"),
+        "thumbnails": {
+            "default": snippet.get("thumbnails", {}).get("default", {}).get("url"),
+            "medium": snippet.get("thumbnails", {}).get("medium", {}).get("url"),
+            "high": snippet.get("thumbnails", {}).get("high", {}).get("url"),
+        },
+        "publishedAt": snippet.get("publishedAt"),
+        "syncedAt": datetime.utcnow().isoformat() + "Z",
+    }
 
 
-def fetch_channel_videos(channel_id: str, api_key: str, max_results: int = 50) -> list:
-    """YouTube 채널의 최신 영상 목록 가져오기"""
+def walk_uploads(
+    client: YouTubeClient,
+    playlist_id: str,
+    channel_id: str,
+    classify,
+    limit: int = None,
+    page_token: str = None,
+    conditional: bool = False,
+) -> tuple:
+    """업로드 목록(최신순)을 page_token부터 페이지 단위로 읽기
+
+    classify(영상)가 "take"면 수집, "skip"이면 건너뛰고, "stop"이면 멈춘다.
+    conditional이면 첫 페이지를 조건부 요청으로 보내 304면 바로 멈춘다.
+    반환값: (영상 목록, 이어서 읽을 페이지 토큰, 조회 페이지 수)
+    토큰은 limit에 닿았거나 요청이 실패해 끝까지 읽지 못했을 때만 있다.
+    """
     videos = []
+    pages = 0
 
-    # 1. 채널의 uploads 플레이리스트 ID 가져오기
-    channel_url = (
-        f"{YOUTUBE_API_BASE}/channels?"
-        f"part=contentDetails&id={channel_id}&key={api_key}"
-    )
+    while True:
+        params = {
+            "part": "snippet,contentDetails",
+            "maxResults": 50 if limit is None else min(50, limit - len(videos)),
+            "playlistId": playlist_id,
+        }
+        if page_token:
+            params["pageToken"] = page_token
+
+        try:
+            playlist_data, changed = client.fetch("playlistItems", params, cache=conditional and not page_token)
+        except YouTubeAPIError as e:
+            print(f"[ERROR] 영상 목록 가져오기 실패: {e}")
+            # 이미 받은 페이지는 유지하고 실패한 페이지부터 다음 실행에서 이어서 동기화
+            return videos, page_token, pages
+        pages += 1
+        if not changed:
+            return videos, None, pages
 
+        for item in playlist_data.get("items", []):
+            video = parse_playlist_item(item, channel_id)
+            if not video["videoId"]:
+                continue
+            action = classify(video)
+            if action == "stop":
+                return videos, None, pages
+            if action == "take":
+                videos.append(video)
+
+        page_token = playlist_data.get("nextPageToken")
+        if not page_token:
+            return videos, None, pages
+        if limit is not None and len(videos) >= limit:
+            return videos, page_token, pages
+
+
+def fetch_channel_videos(channel_id: str, client: YouTubeClient, max_results: int = 50, full: bool = False) -> tuple:
+    """YouTube 채널 영상 목록 가져오기
+
+    기본은 증분 모드: 업로드 목록(최신순)을 페이지 단위로 읽다가 인덱스에 이미
+    있는 영상(또는 워터마크 이전 영상)을 만나면 멈춘다. 한 번에 최대 max_results개.
+    최대 개수에 닿아 기존 영상까지 내려가지 못하면 그 지점(페이지 토큰과 마지막
+    영상 시각)을 남겨 두고, 다음 실행에서 새 업로드를 받은 뒤 남은 개수만큼 이어서
+    가져온다. full=True면 nextPageToken을 끝까지 따라가 채널 전체를 가져온다.
+
+    반환값: (새 영상 목록, 남은 구간 목록)
+    """
+    resume = [] if full else load_sync_resume(channel_id)
+
+    # 1. 채널의 uploads 플레이리스트 ID 가져오기
     try:
-        req = Request(channel_url, headers={"User-Agent": "PARKSY-Publisher/2.0"})
-        with urlopen(req, timeout=30) as response:
-            channel_data = json.loads(response.read().decode())
+        channel_data = client.get("channels", {"part": "contentDetails", "id": channel_id}, cache=True)
 
         if not channel_data.get("items"):
             print(f"[ERROR] 채널을 찾을 수 없습니다: {channel_id}")
-            return []
+            return [], resume
 
         uploads_playlist = channel_data["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
 
-    except (HTTPError, URLError) as e:
+    except YouTubeAPIError as e:
         print(f"[ERROR] 채널 정보 가져오기 실패: {e}")
-        return []
+        return [], resume
 
-    # 2. 플레이리스트에서 영상 목록 가져오기
-    playlist_url = (
-        f"{YOUTUBE_API_BASE}/playlistItems?"
-        f"part=snippet,contentDetails&maxResults={max_results}"
-        f"&playlistId={uploads_playlist}&key={api_key}"
-    )
+    # 2. 새 업로드 (첫 페이지는 조건부 요청: 304면 새 업로드 없음)
+    known_ids, watermark = (set(), "") if full else load_sync_watermark(channel_id)
 
-    try:
-        req = Request(playlist_url, headers={"User-Agent": "PARKSY-Publisher/2.0"})
-        with urlopen(req, timeout=30) as response:
-            playlist_data = json.loads(response.read().decode())
+    def classify_new(video: dict) -> str:
+        if video["videoId"] in known_ids or (watermark and (video["publishedAt"] or "") < watermark):
+            return "stop"
+        return "take"
 
-        for item in playlist_data.get("items", []):
-            snippet = item.get("snippet", {})
-            video = {
-                "videoId": snippet.get("resourceId", {}).get("videoId"),
-                "title": snippet.get("title"),
-                "description": snippet.get("description", "")[:500],  # 처음 500자만
-                "channelId": channel_id,
-                "channelTitle": snippet.get("channelTitle"),
-                "thumbnails": {
-                    "default": snippet.get("thumbnails", {}).get("default", {}).get("url"),
-                    "medium": snippet.get("thumbnails", {}).get("medium", {}).get("url"),
-                    "high": snippet.get("thumbnails", {}).get("high", {}).get("url"),
-                },
-                "publishedAt": snippet.get("publishedAt"),
-                "syncedAt": datetime.utcnow().isoformat() + "Z",
-            }
-            if video["videoId"]:
-                videos.append(video)
-
-    except (HTTPError, URLError) as e:
-        print(f"[ERROR] 영상 목록 가져오기 실패: {e}")
-        return []
-
-    return videos
+    videos, page_token, pages = walk_uploads(
+        client, uploads_playlist, channel_id, classify_new,
+        limit=None if full else max_results, conditional=not full,
+    )
+    remaining = []
+    if page_token and videos:
+        remaining.append({"pageToken": page_token, "before": videos[-1]["publishedAt"] or ""})
+
+    # 3. 이전 실행에서 남은 구간 이어서 가져오기
+    seen_ids = known_ids | {v["videoId"] for v in videos}
+    for gap in resume:
+        budget = max_results - len(videos)
+        if budget <= 0:
+            remaining.append(gap)
+            continue
 
+        def classify_gap(video: dict, before: str = gap["before"]) -> str:
+            if video["videoId"] not in seen_ids:
+                return "take"
+            # 새 업로드로 페이지가 밀려 겹친 영상은 건너뛰고, 구간보다 오래된 기존 영상에서 멈춤
+            return "skip" if (video["publishedAt"] or "") >= before else "stop"
 
-def fetch_video_details(video_ids: list, api_key: str) -> dict:
+        gap_videos, page_token, gap_pages = walk_uploads(
+            client, uploads_playlist, channel_id, classify_gap,
+            limit=budget, page_token=gap["pageToken"],
+        )
+        videos.extend(gap_videos)
+        seen_ids.update(v["videoId"] for v in gap_videos)
+        pages += gap_pages
+        if page_token:
+            remaining.append({
+                "pageToken": page_token,
+                "before": (gap_videos[-1]["publishedAt"] or "") if gap_videos else gap["before"],
+            })
+
+    # 채널을 동시에 가져오므로 한 번에 출력 (줄이 섞이지 않게)
+    note = f", 남은 구간 {len(remaining)}개 (다음 실행에서 이어서)" if remaining else ""
+    print(f"      {channel_id}: playlistItems {pages}페이지 조회, 새 영상 {len(videos)}개{note}\n", end="")
+    return videos, remaining
+
+
+def fetch_video_details(video_ids: list, client: YouTubeClient, part: str = "contentDetails,statistics") -> dict:
     """영상 상세 정보 가져오기 (duration, tags 등)"""
     if not video_ids:
         return {}
 
+    # API는 최대 50개씩 처리, 배치는 클라이언트 동시성 한도 내에서 병렬 요청
+    batches = [
+        {"part": part, "id": ",".join(video_ids[i:i+50])}
+        for i in range(0, len(video_ids), 50)
+    ]
+
     details = {}
-    # API는 최대 50개씩 처리
-    for i in range(0, len(video_ids), 50):
-        batch = video_ids[i:i+50]
-        ids_str = ",".join(batch)
-
-        url = (
-            f"{YOUTUBE_API_BASE}/videos?"
-            f"part=contentDetails,statistics&id={ids_str}&key={api_key}"
-        )
+    for data in client.get_many("videos", batches):
+        if isinstance(data, YouTubeAPIError):
+            print(f"[WARN] 영상 상세 정보 가져오기 실패: {data}")
+            continue
 
-        try:
-            req = Request(url, headers={"User-Agent": "PARKSY-Publisher/2.0"})
-            with urlopen(req, timeout=30) as response:
-                data = json.loads(response.read().decode())
+        for item in data.get("items", []):
+            video_id = item["id"]
+            details[video_id] = {
+                "viewCount": item.get("statistics", {}).get("viewCount"),
+                "likeCount": item.get("statistics", {}).get("likeCount"),
+            }
+            if "contentDetails" in item:
+                details[video_id]["duration"] = item["contentDetails"].get("duration")
 
-            for item in data.get("items", []):
-                video_id = item["id"]
-                details[video_id] = {
-                    "duration": item.get("contentDetails", {}).get("duration"),
-                    "viewCount": item.get("statistics", {}).get("viewCount"),
-                    "likeCount": item.get("statistics", {}).get("likeCount"),
-                }
+    return details
 
-        except (HTTPError, URLError) as e:
-            print(f"[WARN] 영상 상세 정보 가져오기 실패: {e}")
 
-    return details
+def fetch_video_stats(channel_ids: list, new_details: dict, client: YouTubeClient,
+                      recent_days: int = STATS_RECENT_DAYS) -> dict:
+    """최근 recent_days일 안에 게시된 영상의 현재 조회수/좋아요 수 (0이면 인덱스 전체)
 
+    새 영상은 상세 정보를 재사용한다. 요청 수가 채널 크기가 아니라 최근 영상 수에
+    비례하도록, 오래된 영상은 가끔 --stats-days 0으로 따로 갱신한다.
+    """
+    cutoff = (datetime.utcnow() - timedelta(days=recent_days)).isoformat() + "Z" if recent_days else ""
+    known_ids = [
+        v["videoId"]
+        for channel_id in channel_ids
+        for v in load_channel_videos(channel_id)
+        if v["videoId"] not in new_details and (v.get("publishedAt") or "") >= cutoff
+    ]
+    stats = fetch_video_details(known_ids, client, part="statistics")
+    stats.update(new_details)
+    return stats
 
-def update_youtube_index(videos: list, channel_id: str) -> None:
-    """YouTube 인덱스 파일 업데이트"""
-    YOUTUBE_DIR.mkdir(parents=True, exist_ok=True)
 
-    index_file = YOUTUBE_DIR / "index.json"
+def record_video_stats(stats: dict) -> None:
+    """통계 스냅샷 추가 (인덱스 파일은 다시 쓰지 않음)"""
+    rows = StatsStore(STATS_DIR).append(stats)
+    if rows:
+        print(f"[OK] 영상 통계 스냅샷 기록: {rows}개 영상")
+
+
+def sync_channels(channel_ids: list, client: YouTubeClient, max_results: int = 50, full: bool = False) -> dict:
+    """여러 채널의 새 영상을 동시에 가져오기 (채널 ID → (영상 목록, 남은 구간), 입력 순서 유지)"""
+    def fetch(channel_id: str) -> tuple:
+        return fetch_channel_videos(channel_id, client, max_results, full)
+
+    if len(channel_ids) <= 1:
+        return {channel_id: fetch(channel_id) for channel_id in channel_ids}
+
+    with ThreadPoolExecutor(max_workers=min(len(channel_ids), client.max_workers)) as executor:
+        return dict(zip(channel_ids, executor.map(fetch, channel_ids)))
 
-    # 기존 데이터 로드
-    existing_videos = {}
-    if index_file.exists():
-        try:
-            with open(index_file, "r", encoding="utf-8") as f:
-                existing = json.load(f)
-                for v in existing.get("items", []):
-                    existing_videos[v["videoId"]] = v
-        except json.JSONDecodeError:
-            pass
-
-    # 새 영상 병합 (기존 데이터 유지하면서 업데이트)
-    for video in videos:
-        video_id = video["videoId"]
-        if video_id in existing_videos:
-            # 기존 linked publications 유지
-            video["linkedPublications"] = existing_videos[video_id].get("linkedPublications", [])
-        else:
-            video["linkedPublications"] = []
-        existing_videos[video_id] = video
-
-    # 날짜순 정렬
-    sorted_videos = sorted(
-        existing_videos.values(),
-        key=lambda x: x.get("publishedAt", ""),
-        reverse=True
-    )
 
-    # 인덱스 파일 저장
+def update_youtube_index(results: dict, resume: dict = None) -> list:
+    """YouTube 인덱스 업데이트 (채널 ID → 새 영상 목록, 병합된 전체 영상 목록 반환)
+
+    영상은 data/youtube/channels/<채널ID>.json 샤드에 저장하고, index.json에는
+    채널 목록과 채널별 남은 구간(resume: 채널 ID → 구간 목록)만 둔다.
+    변경된 샤드와 index.json을 한 번씩만 쓴다.
+    """
+    resume = resume or {}
+    YOUTUBE_DIR.mkdir(parents=True, exist_ok=True)
+
+    index = read_json(INDEX_FILE, {})
+    channels = index.get("channels", {}) if index.get("version") == INDEX_VERSION else {}
+    synced_at = datetime.utcnow().isoformat() + "Z"
+
+    # v1 단일 인덱스의 채널은 이번 동기화 대상이 아니어도 샤드로 옮김
+    synced_channels = set(results)
+    results = dict(results)
+    if index.get("version") != INDEX_VERSION:
+        for v in index.get("items", []):
+            results.setdefault(v.get("channelId"), [])
+    results.pop(None, None)
+
+    channel_videos = {}
+    for channel_id, videos in results.items():
+        # 기존 데이터 로드
+        existing_videos = {v["videoId"]: v for v in load_channel_videos(channel_id)}
+
+        # 새 영상 병합 (기존 데이터 유지하면서 업데이트)
+        for video in videos:
+            video_id = video["videoId"]
+            if video_id in existing_videos:
+                # 기존 linked publications 유지
+                video["linkedPublications"] = existing_videos[video_id].get("linkedPublications", [])
+            else:
+                video["linkedPublications"] = []
+            existing_videos[video_id] = video
+
+        # 날짜순 정렬
+        sorted_videos = sorted(
+            existing_videos.values(),
+            key=lambda x: x.get("publishedAt", ""),
+            reverse=True
+        )
+        channel_videos[channel_id] = sorted_videos
+
+        # 새 영상이 없으면 샤드는 그대로 두고 동기화 시각만 갱신
+        shard_file = channel_shard_file(channel_id)
+        if videos or not shard_file.exists():
+            write_json(shard_file, {
+                "$schema": "../../config/schemas.json#/schemas/youtubeVideo",
+                "collection": "youtube",
+                "channelId": channel_id,
+                "lastSynced": synced_at,
+                "count": len(sorted_videos),
+                "items": sorted_videos
+            })
+
+        gaps = resume.get(channel_id, channels.get(channel_id, {}).get("resume", []))
+        channels[channel_id] = {
+            "path": f"channels/{channel_id}.json",
+            "count": len(sorted_videos),
+            "latestPublishedAt": sorted_videos[0].get("publishedAt") if sorted_videos else None,
+            "lastSynced": synced_at if channel_id in synced_channels else index.get("lastSynced"),
+        }
+        if gaps:
+            channels[channel_id]["resume"] = gaps
+
+    # 인덱스 파일 저장 (채널 목록만)
     index_data = {
-        "$schema": "../config/schemas.json#/schemas/youtubeVideo",
         "collection": "youtube",
-        "version": "1.0.0",
-        "channelId": channel_id,
-        "lastSynced": datetime.utcnow().isoformat() + "Z",
-        "count": len(sorted_videos),
-        "items": sorted_videos
+        "version": INDEX_VERSION,
+        "lastSynced": synced_at,
+        "count": sum(c["count"] for c in channels.values()),
+        "channels": channels
     }
 
-    with open(index_file, "w", encoding="utf-8") as f:
-        json.dump(index_data, f, indent=2, ensure_ascii=False)
+    write_json(INDEX_FILE, index_data)
 
-    print(f"[OK] YouTube 인덱스 업데이트 완료: {len(sorted_videos)}개 영상")
+    # 전체 영상 (이번에 쓰지 않은 채널은 샤드에서 로드)
+    all_videos = []
+    for channel_id in channels:
+        all_videos.extend(channel_videos.get(channel_id) or load_channel_videos(channel_id))
+    all_videos.sort(key=lambda x: x.get("publishedAt", ""), reverse=True)
 
+    print(f"[OK] YouTube 인덱스 업데이트 완료: {len(channels)}개 채널, {len(all_videos)}개 영상")
+    return all_videos
 
-def update_api_endpoint(videos: list, channel_id: str) -> None:
+
+def update_api_endpoint(videos: list, channel_ids: list) -> None:
     """API 엔드포인트 업데이트"""
     API_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -190,7 +409,8 @@ def update_api_endpoint(videos: list, channel_id: str) -> None:
         "data": {
             "videos": videos[:20],  # 최신 20개만 API에 노출
             "total": len(videos),
-            "channelId": channel_id,
+            "channelId": channel_ids[0] if len(channel_ids) == 1 else None,
+            "channels": channel_ids,
             "lastSynced": datetime.utcnow().isoformat() + "Z"
         },
         "meta": {
@@ -199,35 +419,25 @@ def update_api_endpoint(videos: list, channel_id: str) -> None:
         }
     }
 
-    with open(api_file, "w", encoding="utf-8") as f:
-        json.dump(api_data, f, indent=2, ensure_ascii=False)
+    write_json(api_file, api_data)
 
     print(f"[OK] API 엔드포인트 업데이트 완료")
 
 
-def create_publication_drafts(videos: list) -> int:
-    """새 영상에 대한 출판물 초안 생성"""
+def create_publication_drafts(videos: list) -> list:
+    """새 영상에 대한 출판물 초안 생성 (생성된 파일 경로 목록 반환)"""
     PUB_DIR = DATA_DIR / "publications"
     PUB_DIR.mkdir(parents=True, exist_ok=True)
 
-    # 기존 출판물 확인
-    pub_index_file = PUB_DIR / "index.json"
-    existing_video_ids = set()
-
-    if pub_index_file.exists():
-        try:
-            with open(pub_index_file, "r", encoding="utf-8") as f:
-                pub_data = json.load(f)
-                for pub in pub_data.get("items", []):
-                    for yt in pub.get("media", {}).get("youtube", []):
-                        existing_video_ids.add(yt.get("videoId"))
-        except json.JSONDecodeError:
-            pass
+    # 기존 출판물 확인 (영상 → 출판물 역색인, 없으면 요약 인덱스로 생성)
+    video_index = VideoIndex(PUB_DIR)
+    if not video_index.exists:
+        video_index.rebuild(PublicationStore(PUB_DIR).summaries())
 
     # 새 영상에 대한 출판물 초안 생성
-    created = 0
+    created = []
     for video in videos:
-        if video["videoId"] in existing_video_ids:
+        if video["videoId"] in video_index:
             continue
 
         pub_id = f"pub-{video['publishedAt'][:10]}-{video['videoId'][:8]}"
@@ -261,71 +471,46 @@ def create_publication_drafts(videos: list) -> int:
 
         # 개별 출판물 파일 저장
         pub_file = PUB_DIR / f"{pub_id}.json"
-        with open(pub_file, "w", encoding="utf-8") as f:
-            json.dump(publication, f, indent=2, ensure_ascii=False)
-
-        created += 1
+        write_json(pub_file, publication)
+        video_index.add(pub_id, [video["videoId"]])
 
-    if created > 0:
-        print(f"[OK] 출판물 초안 {created}개 생성됨")
+        created.append(pub_file)
 
-    return created
+    video_index.save()
 
+    if created:
+        print(f"[OK] 출판물 초안 {len(created)}개 생성됨")
 
-def update_publications_index() -> None:
-    """출판물 인덱스 업데이트"""
-    PUB_DIR = DATA_DIR / "publications"
-    pub_index_file = PUB_DIR / "index.json"
-
-    publications = []
-    for f in PUB_DIR.glob("pub-*.json"):
-        try:
-            with open(f, "r", encoding="utf-8") as fp:
-                pub = json.load(fp)
-                publications.append(pub)
-        except json.JSONDecodeError:
-            continue
+    return created
 
-    # 날짜순 정렬
-    publications.sort(key=lambda x: x.get("createdAt", ""), reverse=True)
 
-    index_data = {
-        "$schema": "../config/schemas.json#/schemas/publication",
-        "collection": "publications",
-        "version": "1.0.0",
-        "count": len(publications),
-        "lastUpdated": datetime.utcnow().isoformat() + "Z",
-        "items": publications
-    }
+def update_publications_index(paths: list) -> None:
+    """출판물 인덱스 업데이트 (미디어 파이프라인과 동일한 인덱스/정적 API 생성기 사용)
 
-    with open(pub_index_file, "w", encoding="utf-8") as f:
-        json.dump(index_data, f, indent=2, ensure_ascii=False)
+    새 초안 파일만 다시 읽고 나머지는 기존 인덱스를 그대로 쓴다.
+    """
+    MediaPipeline().update_index(paths=paths)
 
-    # API 엔드포인트도 업데이트
-    api_file = API_DIR / "publications.json"
-    api_data = {
-        "success": True,
-        "data": {
-            "publications": [p for p in publications if p.get("status") == "published"][:20],
-            "total": len([p for p in publications if p.get("status") == "published"]),
-            "page": 1,
-            "perPage": 20
-        },
-        "meta": {
-            "generatedAt": datetime.utcnow().isoformat() + "Z",
-            "source": "/data/publications/index.json"
-        }
-    }
 
-    with open(api_file, "w", encoding="utf-8") as f:
-        json.dump(api_data, f, indent=2, ensure_ascii=False)
+def print_request_summary(client: YouTubeClient) -> None:
+    """API 요청/캐시 통계 출력"""
+    stats = client.stats
+    print(f"      API 요청 {stats['requests']}회 (재시도 {stats['retries']}, 실패 {stats['errors']})")
+    if client.cache is not None:
+        print(f"      HTTP 캐시: 적중 {client.cache.hits} / 미스 {client.cache.misses} (304 재사용)")
 
 
 def main():
     parser = argparse.ArgumentParser(description="PARKSY YouTube Auto-Sync")
-    parser.add_argument("--channel-id", help="YouTube 채널 ID")
+    parser.add_argument("--channel-id", nargs="+", help="YouTube 채널 ID (여러 개 가능, 없으면 platform.json 목록)")
     parser.add_argument("--api-key", help="YouTube API 키 (또는 YOUTUBE_API_KEY 환경변수)")
-    parser.add_argument("--max-results", type=int, default=50, help="가져올 최대 영상 수")
+    parser.add_argument("--max-results", type=int, default=50, help="한 번에 가져올 최대 영상 수 (증분 모드, 나머지는 다음 실행에서 이어서)")
+    parser.add_argument("--full", action="store_true", help="채널 전체 영상 백필 (페이지 끝까지)")
+    parser.add_argument("--workers", type=int, default=4, help="상세 정보 배치 동시 요청 수")
+    parser.add_argument("--no-cache", action="store_true", help="ETag 조건부 요청 캐시 사용 안 함")
+    parser.add_argument("--no-stats", action="store_true", help="조회수/좋아요 수 시계열 수집 안 함")
+    parser.add_argument("--stats-days", type=int, default=STATS_RECENT_DAYS,
+                        help=f"통계를 다시 받을 기존 영상의 게시 후 일수 (기본 {STATS_RECENT_DAYS}, 0이면 전체)")
     parser.add_argument("--dry-run", action="store_true", help="실제 저장 없이 테스트")
     args = parser.parse_args()
 
@@ -336,34 +521,55 @@ def main():
         print("  --api-key 옵션 또는 YOUTUBE_API_KEY 환경변수를 설정하세요.")
         sys.exit(1)
 
-    # 채널 ID 확인
-    channel_id = args.channel_id or os.environ.get("YOUTUBE_CHANNEL_ID")
-    if not channel_id:
+    # 채널 ID 확인 (옵션 → platform.json 채널 목록 → 환경변수 → platform.json channelId)
+    channel_ids = args.channel_id or load_channel_config(os.environ.get("YOUTUBE_CHANNEL_ID"))
+    if not channel_ids:
         print("[ERROR] YouTube 채널 ID가 필요합니다.")
-        print("  --channel-id 옵션 또는 YOUTUBE_CHANNEL_ID 환경변수를 설정하세요.")
+        print("  --channel-id 옵션, YOUTUBE_CHANNEL_ID 환경변수 또는")
+        print("  data/config/platform.json의 integrations.youtube.channels를 설정하세요.")
         sys.exit(1)
 
     print("=" * 60)
     print("PARKSY YouTube Auto-Sync")
     print("=" * 60)
-    print(f"채널 ID: {channel_id}")
-    print(f"최대 결과: {args.max_results}")
+    print(f"채널: {', '.join(channel_ids)}")
+    print(f"모드: {'전체 백필' if args.full else f'증분 (최대 {args.max_results}개)'}")
     print()
 
     # 1. 영상 목록 가져오기
     print("[1/5] YouTube 채널 영상 가져오는 중...")
-    videos = fetch_channel_videos(channel_id, api_key, args.max_results)
+    base_url = os.environ.get("YOUTUBE_API_BASE", YOUTUBE_API_BASE)
+    cache = None if args.no_cache else ResponseCache(HTTP_CACHE_FILE)
+    with YouTubeClient(api_key, base_url=base_url, max_workers=args.workers, cache=cache) as client:
+        fetched = sync_channels(channel_ids, client, args.max_results, full=args.full)
+        results = {channel_id: channel_videos for channel_id, (channel_videos, _) in fetched.items()}
+        resume = {channel_id: gaps for channel_id, (_, gaps) in fetched.items()}
+        videos = [video for channel_videos in results.values() for video in channel_videos]
 
-    if not videos:
-        print("[WARN] 가져온 영상이 없습니다.")
-        sys.exit(0)
+        details = {}
+        if videos:
+            print(f"      {len(videos)}개 영상 발견")
 
-    print(f"      {len(videos)}개 영상 발견")
+            # 2. 영상 상세 정보 가져오기
+            print("[2/5] 영상 상세 정보 가져오는 중...")
+            video_ids = [v["videoId"] for v in videos]
+            details = fetch_video_details(video_ids, client)
 
-    # 2. 영상 상세 정보 가져오기
-    print("[2/5] 영상 상세 정보 가져오는 중...")
-    video_ids = [v["videoId"] for v in videos]
-    details = fetch_video_details(video_ids, api_key)
+        # 최근 영상 통계 (새 영상이 없어도 매 동기화마다 수집)
+        stats = {} if args.no_stats else fetch_video_stats(channel_ids, details, client, args.stats_days)
+
+    print_request_summary(client)
+
+    if not videos:
+        # 인덱스에 반영할 영상이 없으므로 ETag와 통계 (남은 구간이 바뀌었으면 그것도) 갱신
+        if not args.dry_run:
+            if any(resume[channel_id] != load_sync_resume(channel_id) for channel_id in channel_ids):
+                update_youtube_index(results, resume)
+            record_video_stats(stats)
+            if cache:
+                cache.save()
+        print("[OK] 새 영상이 없습니다.")
+        sys.exit(0)
 
     for video in videos:
         vid = video["videoId"]
@@ -379,17 +585,22 @@ def main():
 
     # 3. YouTube 인덱스 업데이트
     print("[3/5] YouTube 인덱스 업데이트 중...")
-    update_youtube_index(videos, channel_id)
+    all_videos = update_youtube_index(results, resume)
+    record_video_stats(stats)
+
+    # ETag는 인덱스 반영 후에만 저장 (중간에 실패하면 다음 실행에서 다시 받음)
+    if cache:
+        cache.save()
 
     # 4. API 엔드포인트 업데이트
     print("[4/5] API 엔드포인트 업데이트 중...")
-    update_api_endpoint(videos, channel_id)
+    update_api_endpoint(all_videos, channel_ids)
 
     # 5. 출판물 초안 생성
     print("[5/5] 출판물 초안 생성 중...")
     created = create_publication_drafts(videos)
-    if created > 0:
-        update_publications_index()
+    if created:
+        update_publications_index(created)
 
     print()
     print("=" * 60)